@@ -11,28 +11,72 @@ PROJECT_ROOT = Path(__file__).parent.parent
 SCREENSHOTS_DIR = PROJECT_ROOT / "screenshots"
 LOGS_DIR = PROJECT_ROOT / "logs"
 EXCEL_FILE_PATH = PROJECT_ROOT / "nba_polymarket_prices.xlsx"
+CSV_FILE_PATH = PROJECT_ROOT / "nba_polymarket_prices.csv"  # Append-only price log
+TABLE_XLSX_PATH = PROJECT_ROOT / "nba_polymarket_prices_table.xlsx"  # Flat export of the CSV log
+CHART_SIGNATURES_PATH = SCREENSHOTS_DIR / ".chart_signatures.json"  # Last chart captured per game
+MARKET_IDS_PATH = SCREENSHOTS_DIR / ".market_ids.json"  # Price-history token per game
+FINAL_CACHE_PATH = SCREENSHOTS_DIR / ".final_cache.json"  # Last capture of games that have ended
+GAMES_CACHE_PATH = SCREENSHOTS_DIR / ".games_cache.json"  # Today's games as last listed
+BROWSER_PROFILE_DIR = PROJECT_ROOT / ".browser_profile"  # Chromium profiles kept between runs (HTTP cache)
 
 # URLs
 POLYMARKET_NBA_URL = "https://polymarket.com/sports/nba/games"
+POLYMARKET_CLOB_URL = "https://clob.polymarket.com"  # Price history API
 
 # Timezone
-TIMEZONE = "US/Eastern"
+TIMEZONE = "America/New_York"
 
 # Timing configuration
 REQUEST_DELAY = 2  # Seconds to wait between game page loads
 PAGE_LOAD_TIMEOUT = 60000  # Max milliseconds to wait for page elements
-GRAPH_RENDER_WAIT = 3  # Additional seconds to wait for graph data to render
-NETWORK_IDLE_TIMEOUT = 30000  # Milliseconds to wait for network idle
+GRAPH_RENDER_WAIT = 3  # Max seconds to wait for graph data to render
+PRICE_RENDER_TIMEOUT = 2000  # Max milliseconds to wait for prices once the games list shows
+GAMES_CACHE_MAX_AGE = 15 * 60  # Seconds a cached games list is reused (0 to always re-list)
+
+# Logging
+LOG_LEVEL = "INFO"  # Least severe message printed: "INFO", "SUCCESS", "WARNING" or "ERROR"
 
 # Retry configuration
 RETRY_ATTEMPTS = 3  # Number of retries on network failure
-RETRY_DELAY = 5  # Seconds between retries
+RETRY_DELAY = 5  # Seconds before the first retry, doubling after each failure
+RETRY_MAX_DELAY = 60  # Longest wait between retries, in seconds
+
+# Polymarket CLOB API rate limiting (token bucket shared by all workers)
+CLOB_RATE_LIMIT = 150  # Requests per second refilled into the bucket
+CLOB_BURST_LIMIT = 1500  # Bucket capacity
+CLOB_MAX_CONCURRENT_REQUESTS = 15  # Price histories fetched at once before processing games
 
 # Browser configuration
 DEFAULT_VIEWPORT = {"width": 1920, "height": 1080}
 DEFAULT_HEADLESS = True
+SCREENSHOT_MAX_SIZE = (700, 300)  # Chart screenshots are scaled down to fit (2x their size in Excel)
+SCREENSHOT_FORMAT = "jpeg"  # "jpeg" or "png"
+SCREENSHOT_QUALITY = 85  # JPEG quality (ignored for PNG)
+MAX_CONCURRENT_GAMES = 3  # Browsers processing games in parallel (keep small to avoid rate limits)
+
+# Requests blocked in every browser page: images, media and analytics that nothing
+# here reads. Fonts are left alone since chart labels end up in the screenshots.
+BLOCKED_URL_PATTERNS = [
+    "*.png*",
+    "*.jpg*",
+    "*.jpeg*",
+    "*.gif*",
+    "*.webp*",
+    "*.avif*",
+    "*.mp4*",
+    "*.webm*",
+    "*/_next/image*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*segment.io*",
+    "*segment.com*",
+    "*datadoghq.com*",
+    "*sentry.io*",
+    "*hotjar.com*",
+    "*intercom.io*",
+]
 
-# Excel column headers
+# Column headers for the CSV price log and its flat XLSX export
 EXCEL_HEADERS = [
     "Timestamp",
     "Game ID",
@@ -21,18 +21,31 @@ Row 10: Captured: 07:00 AM - FINAL  Captured: 07:00 AM  Captured: 07:00 AM
 ...
 """
 
+import csv
+import os
+import warnings
+import weakref
+import zipfile
+from copy import copy
 from dataclasses import dataclass
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
+from xml.etree import ElementTree
 from typing import List, Optional, Dict, Tuple
-from datetime import datetime
+from datetime import datetime, timezone
 
+import xlsxwriter
 from openpyxl import Workbook, load_workbook
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+from openpyxl.styles.styleable import StyleArray
 from openpyxl.drawing.image import Image as XLImage
 from openpyxl.utils import get_column_letter
+from openpyxl.writer.excel import ExcelWriter
+from PIL import Image as PILImage
 
-from .config import EXCEL_FILE_PATH
-from .utils import get_today_date_str, get_eastern_now, log_info, log_success, log_error, log_warning
+from .config import EXCEL_FILE_PATH, CSV_FILE_PATH, TABLE_XLSX_PATH, EXCEL_HEADERS, SCREENSHOT_MAX_SIZE
+from .utils import get_today_date_str, get_eastern_now, get_iso_timestamp, log_info, log_success, log_error, log_warning
 from .game_screenshotter import GameScreenshotResult
 
 # Layout constants
@@ -41,6 +54,47 @@ HEADER_ROWS = 3  # Row 1: Game title, Row 2: Start time, Row 3: URL
 ROWS_PER_ENTRY = 4  # Each hourly entry: Screenshot, Low prices, Capture time, blank row
 IMAGE_WIDTH = 350  # Screenshot width in pixels for Excel
 IMAGE_HEIGHT = 150  # Screenshot height in pixels for Excel
+EMBED_MAX_SIZE = SCREENSHOT_MAX_SIZE  # Stored resolution; older full-size screenshots are scaled on embed
+
+# Cell styles, built once and shared by every header and entry
+_CENTER_ALIGN = Alignment(horizontal="center", vertical="center")
+_THIN_SIDE = Side(style='thin')
+_THIN_BORDER = Border(left=_THIN_SIDE, right=_THIN_SIDE, top=_THIN_SIDE, bottom=_THIN_SIDE)
+_HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+_TITLE_FONT = Font(bold=True, size=12, color="FFFFFF")
+_START_TIME_FONT = Font(size=10, italic=True)
+_URL_FONT = Font(size=8, color="0066CC", underline="single")
+_LOW_PRICE_FONT = Font(size=9, color="CC6600")  # Orange for low prices
+_CAPTURE_FONT = Font(size=9, italic=True, color="666666")
+_CAPTURE_FINAL_FONT = Font(size=9, italic=True, bold=True, color="008000")  # Green for final
+
+# Full cell styles as (font, fill, border, alignment). Each is registered with
+# a workbook once and then assigned to cells in one go (see _apply_style).
+_TITLE_STYLE = (_TITLE_FONT, _HEADER_FILL, _THIN_BORDER, _CENTER_ALIGN)
+_START_TIME_STYLE = (_START_TIME_FONT, None, _THIN_BORDER, _CENTER_ALIGN)
+_URL_STYLE = (_URL_FONT, None, None, _CENTER_ALIGN)
+_LOW_PRICE_STYLE = (_LOW_PRICE_FONT, None, None, _CENTER_ALIGN)
+_CAPTURE_STYLE = (_CAPTURE_FONT, None, None, _CENTER_ALIGN)
+_CAPTURE_FINAL_STYLE = (_CAPTURE_FINAL_FONT, None, None, _CENTER_ALIGN)
+
+# Style indices registered per workbook: workbook -> {id(style): StyleArray}.
+# Keyed by identity because hashing Font/Border objects is what we avoid.
+_REGISTERED_STYLES: "weakref.WeakKeyDictionary[Workbook, Dict[int, StyleArray]]" = weakref.WeakKeyDictionary()
+
+# Workbook part that lists the sheets, and the tags we read from it
+WORKBOOK_XML_PATH = "xl/workbook.xml"
+_SPREADSHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_SHEETS_TAG = f"{_SPREADSHEET_NS}sheets"
+_SHEET_TAG = f"{_SPREADSHEET_NS}sheet"
+
+# Embedded images live under this prefix inside the xlsx zip
+MEDIA_ARCHIVE_PREFIX = "xl/media/"
+
+# Workbook metadata cached for the life of the process. Entries are stored
+# with the file's mtime and only used while the file is unchanged on disk.
+_GAMES_CACHE: Dict[Tuple[Path, str], Tuple[int, Dict[str, "GameState"]]] = {}
+_ENTRY_COUNT_CACHE: Dict[Tuple[Path, str], Tuple[int, Dict[str, int]]] = {}
+_SHEET_NAMES_CACHE: Dict[Path, Tuple[int, List[str]]] = {}
 
 
 @dataclass
@@ -52,29 +106,67 @@ class GameState:
     column: int
 
 
-def get_games_from_sheet(ws) -> Dict[str, GameState]:
+def get_sheet_values(ws) -> List[tuple]:
+    """
+    Read every cell value of a worksheet in a single pass.
+
+    Works on regular and read-only worksheets alike.
+
+    Args:
+        ws: Worksheet to read
+
+    Returns:
+        List of row tuples, where rows[r - 1][c - 1] is the value at (r, c)
+    """
+    return list(ws.iter_rows(min_row=1, values_only=True))
+
+
+def _sheet_width(rows: List[tuple]) -> int:
+    """Number of columns in get_sheet_values() output."""
+    return max((len(values) for values in rows), default=0)
+
+
+def get_column_values(ws, col: int) -> List:
+    """Read the values of one column (top to bottom) in a single pass."""
+    return [
+        values[0]
+        for values in ws.iter_rows(
+            min_row=1, max_row=ws.max_row, min_col=col, max_col=col, values_only=True
+        )
+    ]
+
+
+def _value_at(rows: List[tuple], row: int, col: int):
+    """Value at 1-based (row, col) of get_sheet_values() output, None if out of range."""
+    if row <= len(rows) and col <= len(rows[row - 1]):
+        return rows[row - 1][col - 1]
+    return None
+
+
+def get_games_from_sheet(ws, rows: Optional[List[tuple]] = None) -> Dict[str, GameState]:
     """
     Get all games from a worksheet with their current state.
 
     Args:
         ws: Worksheet to read from
+        rows: Output of get_sheet_values(ws), if already read
 
     Returns:
         Dict mapping game_id to GameState (url, is_final, column)
     """
     games = {}
+    if rows is None:
+        rows = get_sheet_values(ws)
 
-    col = 1
-    while col <= ws.max_column:
-        title_cell = ws.cell(row=1, column=col).value
+    for col in range(1, _sheet_width(rows) + 1, COLUMNS_PER_GAME):
+        title_cell = _value_at(rows, 1, col)
         if not title_cell:
-            col += COLUMNS_PER_GAME
             continue
 
         # Extract game_id from title (format: "Away @ Home")
         # We need to look at the date in row 2 to construct full game_id
-        time_cell = ws.cell(row=2, column=col).value
-        url_cell = ws.cell(row=3, column=col).value
+        time_cell = _value_at(rows, 2, col)
+        url_cell = _value_at(rows, 3, col)
 
         # Parse date from time cell (format: "HH:MM AM/PM / YYYY-MM-DD")
         game_date = None
@@ -96,7 +188,7 @@ def get_games_from_sheet(ws) -> Dict[str, GameState]:
             game_id = f"{game_date}_{away_team}_{home_team}"
 
             # Check if the game is final by looking at the last timestamp entry
-            is_final = is_game_final(ws, col)
+            is_final = is_game_final(ws, col, rows)
 
             games[game_id] = GameState(
                 game_id=game_id,
@@ -105,42 +197,166 @@ def get_games_from_sheet(ws) -> Dict[str, GameState]:
                 column=col
             )
 
-        col += COLUMNS_PER_GAME
-
     return games
 
 
-def is_game_final(ws, game_col: int) -> bool:
+def is_game_final(ws, game_col: int, rows: Optional[List[tuple]] = None) -> bool:
     """
     Check if a game's last entry is marked as Final.
 
     Args:
         ws: Worksheet
         game_col: Column number for the game
+        rows: Output of get_sheet_values(ws), if already read
 
     Returns:
         True if the last entry contains "FINAL"
     """
-    # Find the last entry row for this game
+    if rows is None:
+        rows = get_sheet_values(ws)
+
+    # Entries are appended in order, so walk back from the last entry row and
+    # stop at the first one this game has a timestamp in
     # Entry structure: Screenshot (row), Low prices (row+1), Timestamp (row+2), Blank (row+3)
-    row = HEADER_ROWS + 1
-    last_timestamp_row = None
+    first_row = HEADER_ROWS + 1
+    last_row = first_row + max(len(rows) - first_row, 0) // ROWS_PER_ENTRY * ROWS_PER_ENTRY
 
-    while row <= ws.max_row:
+    for row in range(last_row, first_row - 1, -ROWS_PER_ENTRY):
         # Timestamp is at row + 2 (after screenshot and low prices)
-        timestamp_cell = ws.cell(row=row + 2, column=game_col).value
-        if timestamp_cell and "Captured" in str(timestamp_cell):
-            last_timestamp_row = row + 2
-        row += ROWS_PER_ENTRY
-
-    if last_timestamp_row:
-        timestamp_value = ws.cell(row=last_timestamp_row, column=game_col).value
-        if timestamp_value and "FINAL" in str(timestamp_value).upper():
-            return True
+        timestamp_value = _value_at(rows, row + 2, game_col)
+        if timestamp_value and "Captured" in str(timestamp_value):
+            return "FINAL" in str(timestamp_value).upper()
 
     return False
 
 
+def count_sheet_entries(ws, rows: Optional[List[tuple]] = None) -> Dict[str, int]:
+    """
+    Count entries per game in a worksheet.
+
+    Args:
+        ws: Worksheet to read from
+        rows: Output of get_sheet_values(ws), if already read
+
+    Returns:
+        Dict mapping game title to entry count
+    """
+    if rows is None:
+        rows = get_sheet_values(ws)
+
+    counts = {}
+
+    # Check each game column
+    for col in range(1, _sheet_width(rows) + 1, COLUMNS_PER_GAME):
+        game_title = _value_at(rows, 1, col)
+        if game_title:
+            # Count entries for this game
+            entry_count = 0
+            for row in range(HEADER_ROWS + 1, len(rows) + 1, ROWS_PER_ENTRY):
+                if _value_at(rows, row + 1, col):  # Check timestamp row
+                    entry_count += 1
+
+            counts[str(game_title)] = entry_count
+
+    return counts
+
+
+def _get_cached(cache: Dict, key, mtime_ns: int):
+    """Return a cached value if it was stored for this mtime, else None."""
+    entry = cache.get(key)
+    if entry is not None and entry[0] == mtime_ns:
+        return entry[1]
+    return None
+
+
+def _cache_sheet_metadata(filepath: Path, mtime_ns: int, ws) -> None:
+    """Store games and entry counts for a sheet as of the given file mtime."""
+    rows = get_sheet_values(ws)
+    key = (filepath.resolve(), ws.title)
+    _GAMES_CACHE[key] = (mtime_ns, get_games_from_sheet(ws, rows))
+    _ENTRY_COUNT_CACHE[key] = (mtime_ns, count_sheet_entries(ws, rows))
+
+
+def _load_sheet_metadata(filepath: Path, date_str: str, mtime_ns: int) -> None:
+    """Load the workbook once and cache everything the metadata getters need."""
+    # Read-only mode streams cell values without building the editable cell graph
+    wb = load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        if date_str in wb.sheetnames:
+            _cache_sheet_metadata(filepath, mtime_ns, wb[date_str])
+        else:
+            key = (filepath.resolve(), date_str)
+            _GAMES_CACHE[key] = (mtime_ns, {})
+            _ENTRY_COUNT_CACHE[key] = (mtime_ns, {})
+        _SHEET_NAMES_CACHE[filepath.resolve()] = (mtime_ns, list(wb.sheetnames))
+    finally:
+        wb.close()
+
+
+class _MediaStoredZipFile(zipfile.ZipFile):
+    """Zip archive that stores embedded images as-is instead of deflating them."""
+
+    def writestr(self, zinfo_or_arcname, data, compress_type=None, compresslevel=None):
+        # PNG/JPEG data is already compressed; deflating it again only burns CPU
+        if isinstance(zinfo_or_arcname, str) and zinfo_or_arcname.startswith(MEDIA_ARCHIVE_PREFIX):
+            compress_type = zipfile.ZIP_STORED
+        super().writestr(zinfo_or_arcname, data, compress_type=compress_type, compresslevel=compresslevel)
+
+
+def save_workbook(wb: Workbook, filepath: Path):
+    """
+    Save a workbook without recompressing its images, replacing the file atomically.
+
+    Same output as wb.save(), except screenshots are stored uncompressed in
+    the zip. The workbook is written to a temporary file next to the target
+    and moved over it, so an interrupted save never leaves a corrupt file.
+
+    Args:
+        wb: Workbook to save
+        filepath: Path to save to
+    """
+    filepath = Path(filepath)
+    tmp_path = filepath.with_name(f"{filepath.name}.tmp")
+
+    try:
+        archive = _MediaStoredZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED, allowZip64=True)
+        wb.properties.modified = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+        ExcelWriter(wb, archive).save()
+        os.replace(tmp_path, filepath)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _apply_style(cell, style: tuple):
+    """
+    Give a cell a full style (font, fill, border, alignment) in one assignment.
+
+    Setting .font/.fill/.border/.alignment one by one looks each of them up
+    in the workbook's style tables per cell. Instead, the indices for each
+    style are looked up once per workbook and copied onto the cell.
+
+    Args:
+        cell: Cell to style
+        style: One of the *_STYLE tuples above
+    """
+    wb = cell.parent.parent
+    registered = _REGISTERED_STYLES.setdefault(wb, {})
+
+    style_array = registered.get(id(style))
+    if style_array is None:
+        font, fill, border, alignment = style
+        style_array = StyleArray()
+        style_array.fontId = wb._fonts.add(font)
+        if fill is not None:
+            style_array.fillId = wb._fills.add(fill)
+        if border is not None:
+            style_array.borderId = wb._borders.add(border)
+        style_array.alignmentId = wb._alignments.add(alignment)
+        registered[id(style)] = style_array
+
+    cell._style = copy(style_array)
+
+
 def get_or_create_workbook(filepath: Path) -> Workbook:
     """Load existing workbook or create a new one."""
     if filepath.exists():
@@ -179,32 +395,36 @@ def find_game_column(ws, game_id: str) -> Optional[int]:
     Returns:
         Column number (1-based) or None if not found
     """
-    # Parse game_id to get away and home teams
-    # Format: "YYYY-MM-DD_Away_Home"
-    parts = game_id.split("_")
-    if len(parts) < 3:
-        return None
-
-    away_team = parts[1]
-    home_team = parts[2]
-    expected_title = f"{away_team} @ {home_team}"
-
-    # Check row 1 for matching game title
-    for col in range(1, ws.max_column + 1, COLUMNS_PER_GAME):
-        cell_value = ws.cell(row=1, column=col).value
-        if cell_value and str(cell_value).strip() == expected_title:
-            return col
-    return None
+    return index_game_columns(ws).get(game_id)
+
+
+def index_game_columns(ws) -> Dict[str, int]:
+    """
+    Map each game on a date sheet to its column from a single pass over row 1.
+
+    Args:
+        ws: Worksheet named after its date (YYYY-MM-DD)
+
+    Returns:
+        Dict mapping game_id to column number (1-based)
+    """
+    columns = {}
+    titles = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+    for col in range(1, len(titles) + 1, COLUMNS_PER_GAME):
+        title = titles[col - 1]
+        if title and "@" in str(title):
+            away_team, home_team = (part.strip() for part in str(title).split("@", 1))
+            columns[f"{ws.title}_{away_team}_{home_team}"] = col
+    return columns
 
 
 def get_next_game_column(ws) -> int:
     """Get the next available column for a new game."""
-    if ws.max_column <= 1 and ws.cell(row=1, column=1).value is None:
-        return 1
+    titles = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
 
     # Find the next empty column group
     col = 1
-    while ws.cell(row=1, column=col).value is not None:
+    while col <= len(titles) and titles[col - 1] is not None:
         col += COLUMNS_PER_GAME
     return col
 
@@ -220,6 +440,8 @@ def get_next_entry_row(ws, game_col: int) -> int:
     Returns:
         Row number for the next entry
     """
+    values = get_column_values(ws, game_col)
+
     # Start after header rows
     row = HEADER_ROWS + 1
 
@@ -227,7 +449,7 @@ def get_next_entry_row(ws, game_col: int) -> int:
     # Entry structure: Screenshot (row), Low prices (row+1), Timestamp (row+2), Blank (row+3)
     # Check the timestamp row (row + 2) since screenshot row may have None value
     # even when an image is embedded there
-    while ws.cell(row=row + 2, column=game_col).value is not None:
+    while row + 2 <= len(values) and values[row + 1] is not None:
         row += ROWS_PER_ENTRY
 
     return row
@@ -243,64 +465,60 @@ def setup_game_header(ws, game_col: int, result: GameScreenshotResult):
         result: GameScreenshotResult with game info
     """
     game = result.game
-
-    # Style definitions
-    header_font = Font(bold=True, size=12)
-    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-    white_font = Font(bold=True, size=12, color="FFFFFF")
-    center_align = Alignment(horizontal="center", vertical="center")
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+    left = get_column_letter(game_col)
+    right = get_column_letter(game_col + 1)
 
     # Row 1: Game title (Away @ Home)
     title_cell = ws.cell(row=1, column=game_col)
     title_cell.value = f"{game.away} @ {game.home}"
-    title_cell.font = white_font
-    title_cell.fill = header_fill
-    title_cell.alignment = center_align
-    title_cell.border = thin_border
-
-    # Merge cells for title (only 2 columns, leave 3rd as spacer)
-    ws.merge_cells(
-        start_row=1, start_column=game_col,
-        end_row=1, end_column=game_col + 1
-    )
+    _apply_style(title_cell, _TITLE_STYLE)
 
     # Row 2: Start time and Date
     time_cell = ws.cell(row=2, column=game_col)
     time_cell.value = f"{game.start_time or 'TBD'} / {game.game_date}"
-    time_cell.font = Font(size=10, italic=True)
-    time_cell.alignment = center_align
-    time_cell.border = thin_border
-
-    # Merge cells for time (only 2 columns)
-    ws.merge_cells(
-        start_row=2, start_column=game_col,
-        end_row=2, end_column=game_col + 1
-    )
+    _apply_style(time_cell, _START_TIME_STYLE)
 
     # Row 3: URL
     url_cell = ws.cell(row=3, column=game_col)
     url_cell.value = game.url or ""
-    url_cell.font = Font(size=8, color="0066CC", underline="single")
-    url_cell.alignment = center_align
+    _apply_style(url_cell, _URL_STYLE)
 
-    # Merge cells for URL (only 2 columns)
-    ws.merge_cells(
-        start_row=3, start_column=game_col,
-        end_row=3, end_column=game_col + 1
-    )
+    # Merge each header row across the 2 content columns (leave 3rd as spacer).
+    # Merging after the cells are styled lets openpyxl copy the borders once.
+    for row in range(1, HEADER_ROWS + 1):
+        ws.merge_cells(f"{left}{row}:{right}{row}")
 
     # Set column widths (2 content columns + 1 narrow spacer)
-    ws.column_dimensions[get_column_letter(game_col)].width = 25
-    ws.column_dimensions[get_column_letter(game_col + 1)].width = 25
+    ws.column_dimensions[left].width = 25
+    ws.column_dimensions[right].width = 25
     ws.column_dimensions[get_column_letter(game_col + 2)].width = 3  # Spacer column
 
 
+@lru_cache(maxsize=64)
+def _embed_image_bytes(path: str, mtime: float) -> bytes:
+    """
+    Get screenshot bytes scaled down to at most EMBED_MAX_SIZE for embedding.
+
+    Excel stores embedded images verbatim, so full-size screenshots bloat the
+    workbook. Cached by path and modification time so the same file is only
+    read and re-encoded once per process.
+    """
+    original = Path(path).read_bytes()
+
+    with PILImage.open(BytesIO(original)) as pil:
+        if pil.width <= EMBED_MAX_SIZE[0] and pil.height <= EMBED_MAX_SIZE[1]:
+            return original
+
+        image_format = pil.format or "PNG"
+        pil.thumbnail(EMBED_MAX_SIZE)
+        buffer = BytesIO()
+        pil.save(buffer, format=image_format, optimize=True)
+
+    # Resampling can add colours to flat images; keep whichever is smaller
+    resized = buffer.getvalue()
+    return resized if len(resized) < len(original) else original
+
+
 def add_entry_to_game(ws, game_col: int, entry_row: int, result: GameScreenshotResult):
     """
     Add a single entry (screenshot + prices + timestamp) to a game column.
@@ -311,24 +529,22 @@ def add_entry_to_game(ws, game_col: int, entry_row: int, result: GameScreenshotR
         entry_row: Row to start this entry
         result: GameScreenshotResult with data
     """
-    center_align = Alignment(horizontal="center", vertical="center")
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+    left = get_column_letter(game_col)
+    right = get_column_letter(game_col + 1)
 
     # Row 1 of entry: Screenshot
     if result.screenshot_path and Path(result.screenshot_path).exists():
         try:
-            img = XLImage(str(result.screenshot_path))
+            screenshot_path = Path(result.screenshot_path)
+            img = XLImage(BytesIO(
+                _embed_image_bytes(str(screenshot_path), screenshot_path.stat().st_mtime)
+            ))
             # Scale image to fit
             img.width = IMAGE_WIDTH
             img.height = IMAGE_HEIGHT
 
             # Position the image
-            cell_ref = f"{get_column_letter(game_col)}{entry_row}"
+            cell_ref = f"{left}{entry_row}"
             ws.add_image(img, cell_ref)
 
             # Set row height to accommodate image
@@ -343,15 +559,12 @@ def add_entry_to_game(ws, game_col: int, entry_row: int, result: GameScreenshotR
         ws.cell(row=entry_row, column=game_col).value = "No screenshot"
 
     # Merge cells for screenshot row (only 2 columns, not the spacer)
-    ws.merge_cells(
-        start_row=entry_row, start_column=game_col,
-        end_row=entry_row, end_column=game_col + 1
-    )
+    ws.merge_cells(f"{left}{entry_row}:{right}{entry_row}")
 
     # Row 2 of entry: Low prices (two separate cells, not merged)
     low_row = entry_row + 1
-    home_low = getattr(result, 'home_low_price', None)
-    away_low = getattr(result, 'away_low_price', None)
+    home_low = result.home_low_price
+    away_low = result.away_low_price
 
     # Away team low in first column
     away_low_cell = ws.cell(row=low_row, column=game_col)
@@ -359,8 +572,7 @@ def add_entry_to_game(ws, game_col: int, entry_row: int, result: GameScreenshotR
         away_low_cell.value = f"{result.game.away} Low: {away_low:.3f}"
     else:
         away_low_cell.value = f"{result.game.away} Low: -"
-    away_low_cell.font = Font(size=9, color="CC6600")  # Orange for low prices
-    away_low_cell.alignment = center_align
+    _apply_style(away_low_cell, _LOW_PRICE_STYLE)
 
     # Home team low in second column
     home_low_cell = ws.cell(row=low_row, column=game_col + 1)
@@ -368,8 +580,7 @@ def add_entry_to_game(ws, game_col: int, entry_row: int, result: GameScreenshotR
         home_low_cell.value = f"{result.game.home} Low: {home_low:.3f}"
     else:
         home_low_cell.value = f"{result.game.home} Low: -"
-    home_low_cell.font = Font(size=9, color="CC6600")  # Orange for low prices
-    home_low_cell.alignment = center_align
+    _apply_style(home_low_cell, _LOW_PRICE_STYLE)
 
     # Row 3 of entry: Capture timestamp
     time_row = entry_row + 2
@@ -377,71 +588,147 @@ def add_entry_to_game(ws, game_col: int, entry_row: int, result: GameScreenshotR
 
     time_cell = ws.cell(row=time_row, column=game_col)
     # Check if this result is marked as final
-    is_final = getattr(result, 'is_final', False)
-    if is_final:
+    if result.is_final:
         time_cell.value = f"Captured: {timestamp} - FINAL"
-        time_cell.font = Font(size=9, italic=True, bold=True, color="008000")  # Green for final
+        _apply_style(time_cell, _CAPTURE_FINAL_STYLE)
     else:
         time_cell.value = f"Captured: {timestamp}"
-        time_cell.font = Font(size=9, italic=True, color="666666")
-    time_cell.alignment = center_align
+        _apply_style(time_cell, _CAPTURE_STYLE)
 
     # Merge timestamp cells (only 2 columns, not the spacer)
-    ws.merge_cells(
-        start_row=time_row, start_column=game_col,
-        end_row=time_row, end_column=game_col + 1
-    )
+    ws.merge_cells(f"{left}{time_row}:{right}{time_row}")
 
     # Row 4 of entry: blank row (spacer between entries)
 
 
-def append_result(result: GameScreenshotResult, filepath: Optional[Path] = None) -> bool:
+class ExcelSession:
     """
-    Append a single game result to the Excel file.
+    Keep a workbook open across several appends and save it once on exit.
 
-    Args:
-        result: GameScreenshotResult to append
-        filepath: Path to the Excel file. Uses default if None.
+    The workbook is parsed once in __enter__ and serialized once in __exit__,
+    so appending N results costs one load and one save instead of N of each.
+    Game columns and next entry rows are indexed once per sheet and then
+    kept up to date in memory, so the sheet is not rescanned per result.
 
-    Returns:
-        True if append succeeded, False otherwise
+    Usage:
+        with ExcelSession(filepath) as session:
+            for result in results:
+                session.append(result)
     """
-    if filepath is None:
-        filepath = EXCEL_FILE_PATH
 
-    filepath = Path(filepath)
-    filepath.parent.mkdir(parents=True, exist_ok=True)
+    def __init__(self, filepath: Optional[Path] = None):
+        if filepath is None:
+            filepath = EXCEL_FILE_PATH
 
-    try:
-        wb = get_or_create_workbook(filepath)
-        ws = get_or_create_date_sheet(wb, result.game.game_date)
+        self.filepath = Path(filepath)
+        self.wb: Optional[Workbook] = None
+        self.appended = 0
+        self._columns: Dict[str, Dict[str, int]] = {}  # sheet -> {game_id: column}
+        self._next_rows: Dict[Tuple[str, int], int] = {}  # (sheet, column) -> next entry row
+
+    def __enter__(self) -> "ExcelSession":
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self.wb = get_or_create_workbook(self.filepath)
+        return self
+
+    def _game_columns(self, ws) -> Dict[str, int]:
+        """Game column index for a sheet, built on first use."""
+        if ws.title not in self._columns:
+            self._columns[ws.title] = index_game_columns(ws)
+        return self._columns[ws.title]
+
+    def append(self, result: GameScreenshotResult) -> int:
+        """
+        Add a result to the open workbook without saving it.
+
+        Args:
+            result: GameScreenshotResult to add
+
+        Returns:
+            Row number where the entry was written
+        """
+        ws = get_or_create_date_sheet(self.wb, result.game.game_date)
+        columns = self._game_columns(ws)
 
         # Find or create column for this game
-        game_col = find_game_column(ws, result.game.game_id)
+        game_col = columns.get(result.game.game_id)
 
         if game_col is None:
             # New game - set up header
             game_col = get_next_game_column(ws)
             setup_game_header(ws, game_col, result)
+            columns[result.game.game_id] = game_col
+            self._next_rows[(ws.title, game_col)] = HEADER_ROWS + 1
             log_info(f"Created new game column at {game_col} for {result.game}")
 
         # Find next entry row for this game
-        entry_row = get_next_entry_row(ws, game_col)
+        key = (ws.title, game_col)
+        if key not in self._next_rows:
+            self._next_rows[key] = get_next_entry_row(ws, game_col)
+        entry_row = self._next_rows[key]
 
         # Add the entry
         add_entry_to_game(ws, game_col, entry_row, result)
+        self._next_rows[key] = entry_row + ROWS_PER_ENTRY
 
-        # Save
-        wb.save(filepath)
-        wb.close()
+        self.appended += 1
+        return entry_row
 
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        try:
+            # Don't persist a half-written batch if something blew up, and
+            # skip the save entirely when nothing was added
+            if exc_type is None and self.appended:
+                save_workbook(self.wb, self.filepath)
+
+                # Refresh cached metadata from memory instead of re-reading the file
+                mtime_ns = self.filepath.stat().st_mtime_ns
+                for title in self._columns:
+                    _cache_sheet_metadata(self.filepath, mtime_ns, self.wb[title])
+                _SHEET_NAMES_CACHE[self.filepath.resolve()] = (mtime_ns, list(self.wb.sheetnames))
+        finally:
+            self.wb.close()
+        return False
+
+
+def append_result(
+    result: GameScreenshotResult,
+    filepath: Optional[Path] = None,
+    session: Optional[ExcelSession] = None,
+) -> bool:
+    """
+    Append a single game result to the Excel file.
+
+    Deprecated: loading and saving the workbook per result is the slowest way
+    to write it. Collect results and call append_results() once per run, or
+    append to an open ExcelSession.
+
+    Args:
+        result: GameScreenshotResult to append
+        filepath: Path to the Excel file. Uses default if None.
+        session: Open ExcelSession to append to instead of the file
+
+    Returns:
+        True if append succeeded, False otherwise
+    """
+    warnings.warn(
+        "append_result() is deprecated; use append_results() or ExcelSession.append()",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+
+    if not result.success:
+        return False
+
+    if session is None:
+        return append_results([result], filepath) == 1
+
+    try:
+        entry_row = session.append(result)
         log_success(f"Added entry for {result.game.game_id} at row {entry_row}")
         return True
-
     except Exception as e:
         log_error(f"Error appending to Excel: {e}")
-        import traceback
-        traceback.print_exc()
         return False
 
 
@@ -460,56 +747,158 @@ def append_results(results: List[GameScreenshotResult], filepath: Optional[Path]
         log_info("No results to append")
         return 0
 
+    successful = [result for result in results if result.success]
+    if not successful:
+        log_info("No successful results to persist")
+        return 0
+
+    try:
+        # Save once at the end
+        with ExcelSession(filepath) as session:
+            for result in successful:
+                try:
+                    session.append(result)
+                except Exception as e:
+                    log_error(f"Error adding {result.game}: {e}")
+
+        log_success(f"Appended {session.appended} entries to Excel")
+        return session.appended
+
+    except Exception as e:
+        log_error(f"Error appending results to Excel: {e}")
+        return 0
+
+
+def result_to_row(result: GameScreenshotResult, timestamp: Optional[str] = None) -> List:
+    """
+    Flatten a result into a row matching EXCEL_HEADERS.
+
+    Args:
+        result: GameScreenshotResult to flatten
+        timestamp: ISO8601 capture time. Uses now if None.
+
+    Returns:
+        List of cell values in EXCEL_HEADERS order
+    """
+    game = result.game
+    return [
+        timestamp or get_iso_timestamp(),
+        game.game_id,
+        game.home,
+        game.away,
+        result.home_price,
+        result.away_price,
+        game.start_time or "",
+        str(result.screenshot_path) if result.screenshot_path else "",
+    ]
+
+
+def append_csv(results: List[GameScreenshotResult], filepath: Optional[Path] = None) -> int:
+    """
+    Append successful results to the CSV price log.
+
+    Each result is a single writerow on a file opened in append mode, so the
+    cost is proportional to the new rows rather than to the size of the log.
+
+    Args:
+        results: List of GameScreenshotResult objects to append
+        filepath: Path to the CSV file. Uses default if None.
+
+    Returns:
+        Number of rows written
+    """
     if filepath is None:
-        filepath = EXCEL_FILE_PATH
+        filepath = CSV_FILE_PATH
 
     filepath = Path(filepath)
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
-    appended = 0
+    rows = [result_to_row(result) for result in results if result.success]
+    if not rows:
+        return 0
 
     try:
-        wb = get_or_create_workbook(filepath)
+        write_header = not filepath.exists() or filepath.stat().st_size == 0
+        with open(filepath, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            if write_header:
+                writer.writerow(EXCEL_HEADERS)
+            for row in rows:
+                writer.writerow(row)
+        return len(rows)
+
+    except Exception as e:
+        log_error(f"Error appending to CSV log: {e}")
+        return 0
+
 
-        for result in results:
-            if not result.success:
-                continue
+def rebuild_xlsx(csv_path: Optional[Path] = None, xlsx_path: Optional[Path] = None) -> int:
+    """
+    Rebuild the flat price table workbook from the CSV price log.
 
-            try:
-                ws = get_or_create_date_sheet(wb, result.game.game_date)
+    The table is a full rewrite, so it is written with xlsxwriter in
+    constant_memory mode: rows are flushed to disk as they are written and
+    memory stays flat no matter how long the log gets. This is meant to be
+    run on demand, not on every scrape.
 
-                # Find or create column for this game
-                game_col = find_game_column(ws, result.game.game_id)
+    Args:
+        csv_path: Path to the CSV log. Uses default if None.
+        xlsx_path: Path of the workbook to write. Uses default if None.
 
-                if game_col is None:
-                    game_col = get_next_game_column(ws)
-                    setup_game_header(ws, game_col, result)
+    Returns:
+        Number of data rows written
+    """
+    if csv_path is None:
+        csv_path = CSV_FILE_PATH
+    if xlsx_path is None:
+        xlsx_path = TABLE_XLSX_PATH
 
-                # Find next entry row
-                entry_row = get_next_entry_row(ws, game_col)
+    csv_path = Path(csv_path)
+    xlsx_path = Path(xlsx_path)
 
-                # Add the entry
-                add_entry_to_game(ws, game_col, entry_row, result)
+    if not csv_path.exists():
+        log_warning(f"No CSV log found at {csv_path}")
+        return 0
 
-                appended += 1
+    price_cols = {EXCEL_HEADERS.index("Home Price"), EXCEL_HEADERS.index("Away Price")}
+    rows_written = 0
 
-            except Exception as e:
-                log_error(f"Error adding {result.game}: {e}")
+    try:
+        xlsx_path.parent.mkdir(parents=True, exist_ok=True)
+        wb = xlsxwriter.Workbook(str(xlsx_path), {"constant_memory": True})
+        ws = wb.add_worksheet("Prices")
+        header_format = wb.add_format({"bold": True})
+
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            ws.write_row(0, 0, header or EXCEL_HEADERS, header_format)
+
+            for row in reader:
+                rows_written += 1
+                # Keep prices numeric so they can be charted/sorted in Excel
+                ws.write_row(rows_written, 0, [
+                    float(value) if i in price_cols and value else value
+                    for i, value in enumerate(row)
+                ])
 
-        # Save once at the end
-        wb.save(filepath)
         wb.close()
 
-        log_success(f"Appended {appended} entries to Excel")
-        return appended
+        log_success(f"Rebuilt {xlsx_path} with {rows_written} rows")
+        return rows_written
 
     except Exception as e:
-        log_error(f"Error appending results to Excel: {e}")
+        log_error(f"Error rebuilding XLSX from CSV: {e}")
         return 0
 
 
 def get_sheet_names(filepath: Optional[Path] = None) -> List[str]:
-    """Get list of sheet names (dates) in the workbook."""
+    """
+    Get list of sheet names (dates) in the workbook.
+
+    Reads the <sheets> list straight out of xl/workbook.xml inside the .xlsx
+    archive instead of loading every sheet (and its images) with openpyxl.
+    """
     if filepath is None:
         filepath = EXCEL_FILE_PATH
 
@@ -519,10 +908,21 @@ def get_sheet_names(filepath: Optional[Path] = None) -> List[str]:
         return []
 
     try:
-        wb = load_workbook(filepath)
-        names = wb.sheetnames
-        wb.close()
-        return names
+        mtime_ns = filepath.stat().st_mtime_ns
+        cached = _get_cached(_SHEET_NAMES_CACHE, filepath.resolve(), mtime_ns)
+        if cached is not None:
+            return list(cached)
+
+        names = []
+        with zipfile.ZipFile(filepath) as archive, archive.open(WORKBOOK_XML_PATH) as xml_file:
+            for _, elem in ElementTree.iterparse(xml_file):
+                if elem.tag == _SHEET_TAG:
+                    names.append(elem.get("name"))
+                elif elem.tag == _SHEETS_TAG:
+                    break  # Nothing after <sheets> is needed
+
+        _SHEET_NAMES_CACHE[filepath.resolve()] = (mtime_ns, names)
+        return list(names)
     except Exception as e:
         log_error(f"Error getting sheet names: {e}")
         return []
@@ -545,43 +945,22 @@ def get_entry_count(filepath: Optional[Path] = None, date_str: Optional[str] = N
         date_str = get_today_date_str()
 
     filepath = Path(filepath)
-    counts = {}
 
     if not filepath.exists():
-        return counts
+        return {}
 
     try:
-        wb = load_workbook(filepath)
-
-        if date_str not in wb.sheetnames:
-            wb.close()
-            return counts
-
-        ws = wb[date_str]
+        mtime_ns = filepath.stat().st_mtime_ns
+        key = (filepath.resolve(), date_str)
 
-        # Check each game column
-        col = 1
-        while col <= ws.max_column:
-            game_title = ws.cell(row=1, column=col).value
-            if game_title:
-                # Count entries for this game
-                entry_count = 0
-                row = HEADER_ROWS + 1
-                while row <= ws.max_row:
-                    if ws.cell(row=row + 1, column=col).value:  # Check timestamp row
-                        entry_count += 1
-                    row += ROWS_PER_ENTRY
+        if _get_cached(_ENTRY_COUNT_CACHE, key, mtime_ns) is None:
+            _load_sheet_metadata(filepath, date_str, mtime_ns)
 
-                counts[str(game_title)] = entry_count
-
-            col += COLUMNS_PER_GAME
-
-        wb.close()
-        return counts
+        return dict(_ENTRY_COUNT_CACHE[key][1])
 
     except Exception as e:
         log_error(f"Error getting entry count: {e}")
-        return counts
+        return {}
 
 
 def get_existing_games(filepath: Optional[Path] = None, date_str: Optional[str] = None) -> Dict[str, GameState]:
@@ -606,16 +985,13 @@ def get_existing_games(filepath: Optional[Path] = None, date_str: Optional[str]
         return {}
 
     try:
-        wb = load_workbook(filepath)
+        mtime_ns = filepath.stat().st_mtime_ns
+        key = (filepath.resolve(), date_str)
 
-        if date_str not in wb.sheetnames:
-            wb.close()
-            return {}
+        if _get_cached(_GAMES_CACHE, key, mtime_ns) is None:
+            _load_sheet_metadata(filepath, date_str, mtime_ns)
 
-        ws = wb[date_str]
-        games = get_games_from_sheet(ws)
-        wb.close()
-        return games
+        return dict(_GAMES_CACHE[key][1])
 
     except Exception as e:
         log_error(f"Error getting existing games: {e}")
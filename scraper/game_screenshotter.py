@@ -4,39 +4,88 @@ Game page screenshotter for Polymarket NBA.
 Handles navigating to the graph view and capturing screenshots.
 """
 
+import hashlib
+import json
+import queue
+import random
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from io import BytesIO
 from pathlib import Path
 from typing import Optional, Tuple, Dict, List
 
-from playwright.sync_api import Page, TimeoutError as PlaywrightTimeout
+from PIL import Image as PILImage
+from playwright.sync_api import (
+    BrowserContext,
+    Page,
+    Playwright,
+    TimeoutError as PlaywrightTimeout,
+    sync_playwright,
+)
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib parser via response.json()
+    orjson = None
 
 from .config import (
+    BLOCKED_URL_PATTERNS,
+    BROWSER_PROFILE_DIR,
+    CHART_SIGNATURES_PATH,
+    CLOB_BURST_LIMIT,
+    CLOB_MAX_CONCURRENT_REQUESTS,
+    CLOB_RATE_LIMIT,
+    DEFAULT_HEADLESS,
+    DEFAULT_VIEWPORT,
+    FINAL_CACHE_PATH,
+    MARKET_IDS_PATH,
+    MAX_CONCURRENT_GAMES,
     PAGE_LOAD_TIMEOUT,
     GRAPH_RENDER_WAIT,
-    NETWORK_IDLE_TIMEOUT,
     REQUEST_DELAY,
     POLYMARKET_NBA_URL,
+    POLYMARKET_CLOB_URL,
+    SCREENSHOT_FORMAT,
+    SCREENSHOT_MAX_SIZE,
+    SCREENSHOT_QUALITY,
+    RETRY_ATTEMPTS,
+    RETRY_DELAY,
 )
 from .selectors import (
     get_moneyline_locator,
     get_graph_locator,
     get_time_period_locator,
     get_chart_locator,
+    get_final_badge_locator,
     get_price_buttons_locator,
     GamePageSelectors,
 )
 from .utils import (
-    parse_price_text,
-    extract_team_from_price,
+    parse_all_prices,
     generate_screenshot_path,
+    get_today_date_str,
+    retry_on_failure,
+    write_json_atomic,
     log_info,
     log_success,
     log_warning,
     log_error,
 )
-from .games_scraper import GameInfo
+from .games_scraper import (
+    GameInfo,
+    click_game_view,
+    install_game_row_extractor,
+    locate_game_index,
+    wait_for_game_page,
+    wait_for_games_to_load,
+)
 
 
 @dataclass
@@ -54,6 +103,88 @@ class GameScreenshotResult:
     away_low_price: Optional[float] = None  # Lowest price away team reached
 
 
+def _create_http_session() -> requests.Session:
+    """Create the HTTP session shared by all price history requests."""
+    session = requests.Session()
+    # One pooled keep-alive connection per worker, so only the first request pays for TLS
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+    session.headers.update({"Accept-Encoding": "gzip"})
+    return session
+
+
+_HTTP_SESSION = _create_http_session()
+
+
+class _PolymarketLimiter:
+    """
+    Token bucket for the CLOB API, shared by every worker thread.
+
+    Tokens refill at `rate` per second up to `burst`. Each request takes one;
+    once the bucket runs dry, callers are told how long to wait for theirs.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token and return the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+
+_CLOB_LIMITER = _PolymarketLimiter(CLOB_RATE_LIMIT, CLOB_BURST_LIMIT)
+
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date), None if absent or invalid."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def clob_get(url: str) -> requests.Response:
+    """
+    GET a CLOB API URL within the rate limit, retrying when told to back off.
+
+    Args:
+        url: Full request URL
+
+    Returns:
+        The response (the last one if every retry was rate limited)
+    """
+    for attempt in range(RETRY_ATTEMPTS + 1):
+        time.sleep(_CLOB_LIMITER.acquire())
+        response = _HTTP_SESSION.get(url, timeout=10)
+
+        if response.status_code != 429 or attempt == RETRY_ATTEMPTS:
+            return response
+
+        # Honor Retry-After, otherwise back off exponentially with jitter
+        wait = _retry_after_seconds(response)
+        if wait is None:
+            wait = 2 ** attempt + random.uniform(0, 1)
+        log_warning(f"Rate limited by CLOB API, retrying in {wait:.1f}s...")
+        time.sleep(wait)
+
+    return response
+
+
 def fetch_price_history(market_id: str, interval: str = "max") -> List[Dict]:
     """
     Fetch price history from Polymarket CLOB API.
@@ -66,207 +197,377 @@ def fetch_price_history(market_id: str, interval: str = "max") -> List[Dict]:
         List of {t: timestamp, p: price} dicts
     """
     try:
-        url = f"https://clob.polymarket.com/prices-history?interval={interval}&market={market_id}"
-        response = requests.get(url, timeout=10)
+        url = f"{POLYMARKET_CLOB_URL}/prices-history?interval={interval}&market={market_id}"
+        response = clob_get(url)
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content) if orjson else response.json()
             return data.get('history', [])
+        log_warning(f"API request failed with status {response.status_code}")
     except Exception as e:
         log_warning(f"Error fetching price history: {e}")
     return []
 
 
-def get_min_price_from_history(history: List[Dict]) -> Optional[float]:
+def fetch_price_histories(market_ids: Dict[str, str], interval: str = "6h") -> Dict[str, List[Dict]]:
     """
-    Get the minimum price from a price history list.
+    Fetch several price histories concurrently.
+
+    Requests still go through the shared rate limiter.
 
     Args:
-        history: List of {t: timestamp, p: price} dicts
+        market_ids: Dict mapping any key (e.g. game_id) to a market/token ID
+        interval: Time interval - "6h", "1d", "1w", "max"
 
     Returns:
-        Minimum price as float, or None if no data
+        Dict mapping the same keys to their history (empty list on failure)
     """
-    if not history:
-        return None
+    if not market_ids:
+        return {}
 
-    prices = [entry.get('p', 1.0) for entry in history if 'p' in entry]
-    if prices:
-        return min(prices)
-    return None
+    workers = min(CLOB_MAX_CONCURRENT_REQUESTS, len(market_ids))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            key: executor.submit(fetch_price_history, market_id, interval)
+            for key, market_id in market_ids.items()
+        }
+    return {key: future.result() for key, future in futures.items()}
 
 
-def extract_market_ids(page: Page) -> Dict[str, str]:
+def prefetch_price_histories(games: List[GameInfo]) -> Dict[str, List[Dict]]:
     """
-    Extract market/token IDs from the page for each team.
+    Fetch the 6h price history of every game whose market ID is already cached.
+
+    Args:
+        games: Games about to be processed
+
+    Returns:
+        Dict mapping game_id to its price history, for the games that had one
+    """
+    market_ids = {
+        game.game_id: _MARKET_ID_CACHE[game.game_id]
+        for game in games
+        if game.game_id in _MARKET_ID_CACHE
+    }
+    if not market_ids:
+        return {}
+
+    log_info(f"Prefetching price history for {len(market_ids)} games...")
+    histories = fetch_price_histories(market_ids, "6h")
+    return {game_id: history for game_id, history in histories.items() if history}
+
+
+def extract_market_ids(page: Page) -> Tuple[Optional[str], Dict[str, str]]:
+    """
+    Extract market/token IDs embedded in the page, in a single evaluation.
 
     Args:
         page: Playwright page object (should be on game detail page)
 
     Returns:
-        Dict mapping team abbreviation to market ID
+        Tuple of (first token ID in the page data, dict mapping team
+        abbreviation to the token ID found on its price button)
     """
     try:
-        # The market IDs are often in data attributes or can be found in network requests
-        # We'll extract them from the price buttons which contain the token info
-        market_ids = page.evaluate('''() => {
+        # The token IDs are in the page's embedded data, and often in data
+        # attributes around the price buttons; look for both in one round trip
+        found = page.evaluate('''() => {
+            // Token IDs are long numeric strings, e.g. "token": "1234..."
+            const TOKEN_RE = /"token"\\s*:\\s*"(\\d{70,80})"/;
+
+            const findToken = () => {
+                // Next.js embeds the page data in one script tag; only that needs searching
+                const nextData = document.getElementById('__NEXT_DATA__');
+                if (nextData) {
+                    const match = (nextData.textContent || '').match(TOKEN_RE);
+                    return match ? match[1] : null;
+                }
+
+                // Without it, check every script tag and then the page text
+                for (const script of document.querySelectorAll('script')) {
+                    const match = (script.textContent || '').match(TOKEN_RE);
+                    if (match) return match[1];
+                }
+
+                const tokenMatch = document.body.innerText.match(/\\b(\\d{70,80})\\b/);
+                return tokenMatch ? tokenMatch[1] : null;
+            };
+
             const results = {};
+            // Price button text like "PHX 87¢" or "OKC 13¢"
+            const BTN_RE = /^([A-Z]{2,3})\\s*(\\d+)¢$/;
+            const DIGITS_RE = /^\\d+$/;
+
+            // Long numeric attribute value of each element, looked up once per element
+            const idCache = new Map();
+            const numericId = (el) => {
+                if (idCache.has(el)) return idCache.get(el);
+                let id = null;
+                for (const attr of el.attributes) {
+                    if (attr.value && attr.value.length > 50 && DIGITS_RE.test(attr.value)) {
+                        id = attr.value;
+                        break;
+                    }
+                }
+                idCache.set(el, id);
+                return id;
+            };
 
             // Look for buttons with price info that might have data attributes
             const buttons = document.querySelectorAll('button');
             for (const btn of buttons) {
                 const text = btn.innerText || '';
-                // Match pattern like "PHX 87¢" or "OKC 13¢"
-                const match = text.match(/^([A-Z]{2,3})\\s*(\\d+)¢$/);
-                if (match) {
-                    const team = match[1];
-                    // Try to find token ID in parent elements or data attributes
+                const match = text.match(BTN_RE);
+                if (match && !(match[1] in results)) {
+                    // Use the token ID on the button or its closest ancestor
                     let el = btn;
-                    for (let i = 0; i < 10; i++) {
-                        if (!el) break;
-                        // Check for data attributes
-                        const attrs = el.attributes;
-                        for (let j = 0; j < attrs.length; j++) {
-                            const attr = attrs[j];
-                            if (attr.value && attr.value.length > 50 && /^\\d+$/.test(attr.value)) {
-                                results[team] = attr.value;
-                            }
+                    for (let i = 0; i < 10 && el; i++) {
+                        const id = numericId(el);
+                        if (id) {
+                            results[match[1]] = id;
+                            break;
                         }
                         el = el.parentElement;
                     }
+                    // A game only has two teams
+                    if (Object.keys(results).length === 2) break;
                 }
             }
 
-            return results;
+            return {token: findToken(), teams: results};
         }''')
 
+        market_ids = found.get("teams") or {}
         if market_ids:
             log_info(f"Found market IDs: {market_ids}")
-            return market_ids
+        return found.get("token"), market_ids
 
     except Exception as e:
         log_warning(f"Error extracting market IDs: {e}")
 
-    return {}
+    return None, {}
+
 
+# Token ID in a prices-history request URL
+_MARKET_ID_RE = re.compile(r'market=(\d+)')
 
-def get_low_prices_from_api(page: Page, game: GameInfo) -> Tuple[Optional[float], Optional[float]]:
+
+def _load_market_ids() -> Dict[str, str]:
+    """Load the {game_id: market_id} cache from disk."""
+    try:
+        with open(MARKET_IDS_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+# Market IDs found on earlier runs, shared by all workers
+_MARKET_ID_CACHE: Dict[str, str] = _load_market_ids()
+_MARKET_ID_LOCK = threading.Lock()
+
+
+def remember_market_id(game: GameInfo, market_id: str):
     """
-    Get the lowest prices each team reached using the Polymarket API.
+    Add a game's market ID to the cache and write the cache to disk.
 
-    The API returns away team prices. Home team price = 1 - away team price.
-    So: away_low = min(away_prices), home_low = 1 - max(away_prices)
+    Args:
+        game: GameInfo object the market ID belongs to
+        market_id: Price-history token ID of the away team
+    """
+    with _MARKET_ID_LOCK:
+        if _MARKET_ID_CACHE.get(game.game_id) == market_id:
+            return
+        _MARKET_ID_CACHE[game.game_id] = market_id
+
+        try:
+            write_json_atomic(MARKET_IDS_PATH, _MARKET_ID_CACHE)
+        except OSError as e:
+            log_warning(f"Could not save market ID cache: {e}")
+
+
+def find_market_id(page: Page, game: GameInfo) -> Optional[str]:
+    """
+    Find the price-history token ID for a game's away team.
+
+    Tries the cache first, then the page's embedded data, then the price
+    buttons. Only as a last resort are time periods clicked to catch the
+    ID in a prices-history request.
 
     Args:
         page: Playwright page object (on game detail page)
         game: GameInfo with team abbreviations
 
+    Returns:
+        Market ID, or None if it couldn't be found
+    """
+    market_id = _MARKET_ID_CACHE.get(game.game_id)
+    if market_id:
+        return market_id
+
+    # Method: Extract from the page's embedded data, then the price buttons,
+    # which may carry the token IDs as attributes
+    market_id, team_ids = extract_market_ids(page)
+    if not market_id:
+        market_id = team_ids.get(game.away)
+
+    if not market_id:
+        # Try to get it from network requests by reloading the graph
+        log_info("Trying to capture market ID from network...")
+
+        # Click a different time period to force a new request
+        try:
+            # First click 1D, then Max to force new requests
+            for btn_text in ["1D", "Max", "1W"]:
+                btn = page.get_by_text(btn_text, exact=True)
+                if btn.count() == 0:
+                    continue
+                try:
+                    with page.expect_response(
+                        lambda r: "prices-history" in r.url, timeout=1500
+                    ) as response_info:
+                        btn.first.click()
+                except PlaywrightTimeout:
+                    continue
+                match = _MARKET_ID_RE.search(response_info.value.url)
+                if match:
+                    market_id = match.group(1)
+                    log_info(f"Captured market ID: {market_id[:30]}...")
+                    break
+        except:
+            pass
+
+    if market_id:
+        remember_market_id(game, market_id)
+    return market_id
+
+
+def get_low_prices_from_history(history: List[Dict]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Work out the lowest prices each team reached from an away team price history.
+
+    The API returns away team prices. Home team price = 1 - away team price.
+    So: away_low = min(away_prices), home_low = 1 - max(away_prices)
+
+    Args:
+        history: List of {t: timestamp, p: price} dicts for the away team.
+            Entries without a price are skipped rather than given a default,
+            which would skew the low/high.
+
     Returns:
         Tuple of (home_low_price, away_low_price)
     """
-    home_low = None
-    away_low = None
+    # Filter to last 6 hours just in case API returns more. One pass tracks the
+    # range of the recent prices and of all prices (used if none are recent).
+    six_hours_ago = time.time() - (6 * 60 * 60)
+    low = high = recent_low = recent_high = None
+    count = recent_count = 0
+
+    for entry in history:
+        try:
+            price = entry['p']
+        except KeyError:
+            continue
+
+        count += 1
+        if low is None or price < low:
+            low = price
+        if high is None or price > high:
+            high = price
+
+        if entry.get('t', 0) >= six_hours_ago:
+            recent_count += 1
+            if recent_low is None or price < recent_low:
+                recent_low = price
+            if recent_high is None or price > recent_high:
+                recent_high = price
+
+    # If filtering removed all prices, use all prices from the response
+    if recent_count:
+        low, high, count = recent_low, recent_high, recent_count
+
+    log_info(f"Got {count} price points from last 6 hours")
+
+    if low is None:
+        return None, None
+
+    away_low = low  # Lowest away team price in last 6h
+    home_low = 1 - high  # Home team's low = 1 - away team's high
+    return home_low, away_low
+
+
+def get_price_history(page: Page, game: GameInfo) -> List[Dict]:
+    """
+    Fetch a game's 6h away team price history, looking up its market ID first.
 
+    Args:
+        page: Playwright page object (on game detail page)
+        game: GameInfo with team abbreviations
+
+    Returns:
+        List of {t: timestamp, p: price} dicts, empty if unavailable
+    """
     try:
-        # Extract market/token ID from the page URL or page content
         # The token ID is needed to call the prices-history API directly
+        market_id = find_market_id(page, game)
+    except Exception as e:
+        log_warning(f"Error finding market ID: {e}")
+        market_id = None
 
-        # Method: Extract from page's JavaScript context
-        market_id = page.evaluate('''() => {
-            // Look for token IDs in the page - they're usually long numeric strings
-            // Check script tags and data embedded in the page
-            const scripts = document.querySelectorAll('script');
-            for (const script of scripts) {
-                const text = script.textContent || '';
-                // Look for token patterns in JSON data
-                const matches = text.match(/"token"\\s*:\\s*"(\\d{70,80})"/g);
-                if (matches && matches.length > 0) {
-                    // Extract the first token ID
-                    const match = matches[0].match(/"(\\d{70,80})"/);
-                    if (match) return match[1];
-                }
-            }
+    if not market_id:
+        log_warning("Could not find market ID for price history")
+        return []
 
-            // Also check for market IDs in URLs within the page
-            const allText = document.body.innerText;
-            const tokenMatch = allText.match(/\\b(\\d{70,80})\\b/);
-            if (tokenMatch) return tokenMatch[1];
+    # Call the API directly - use 6h interval to match our graph timeframe
+    log_info(f"Fetching price history from API (6h)...")
+    return fetch_price_history(market_id, "6h")
 
-            return null;
-        }''')
 
-        if not market_id:
-            # Try to get it from network requests by reloading the graph
-            log_info("Trying to capture market ID from network...")
-            captured_ids = []
+def get_current_prices_from_history(history: List[Dict]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Get the current prices from the latest point of an away team price history.
 
-            def capture_market_id(response):
-                if 'prices-history' in response.url:
-                    import re
-                    match = re.search(r'market=(\d+)', response.url)
-                    if match:
-                        captured_ids.append(match.group(1))
+    Args:
+        history: List of {t: timestamp, p: price} dicts for the away team
 
-            page.on("response", capture_market_id)
+    Returns:
+        Tuple of (home_price, away_price), or (None, None) if history has no prices
+    """
+    for entry in reversed(history):
+        if 'p' in entry:
+            away_price = entry['p']
+            return 1 - away_price, away_price
+    return None, None
+
+
+def get_low_prices_from_api(
+    page: Page,
+    game: GameInfo,
+    history: Optional[List[Dict]] = None,
+) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Get the lowest prices each team reached using the Polymarket API.
 
-            # Click a different time period to force a new request
-            try:
-                # First click 1D, then Max to force new requests
-                for btn_text in ["1D", "Max", "1W"]:
-                    btn = page.get_by_text(btn_text, exact=True)
-                    if btn.count() > 0:
-                        btn.first.click()
-                        time.sleep(1.5)
-                        if captured_ids:
-                            break
-            except:
-                pass
-
-            page.remove_listener("response", capture_market_id)
-
-            if captured_ids:
-                market_id = captured_ids[0]
-                log_info(f"Captured market ID: {market_id[:30]}...")
-
-        if market_id:
-            # Call the API directly - use 6h interval to match our graph timeframe
-            log_info(f"Fetching price history from API (6h)...")
-            url = f"https://clob.polymarket.com/prices-history?interval=6h&market={market_id}"
-            response = requests.get(url, timeout=10)
-
-            if response.status_code == 200:
-                data = response.json()
-                history = data.get('history', [])
-
-                if history:
-                    # Filter to last 6 hours just in case API returns more
-                    import time as time_module
-                    six_hours_ago = time_module.time() - (6 * 60 * 60)
-
-                    # Filter prices to last 6 hours
-                    recent_prices = [
-                        entry.get('p', 0.5)
-                        for entry in history
-                        if 'p' in entry and entry.get('t', 0) >= six_hours_ago
-                    ]
-
-                    # If filtering removed all prices, use all prices from the response
-                    if not recent_prices:
-                        recent_prices = [entry.get('p', 0.5) for entry in history if 'p' in entry]
-
-                    log_info(f"Got {len(recent_prices)} price points from last 6 hours")
-
-                    if recent_prices:
-                        away_low = min(recent_prices)  # Lowest away team price in last 6h
-                        away_high = max(recent_prices)  # Highest away team price in last 6h
-                        home_low = 1 - away_high  # Home team's low = 1 - away team's high
-
-                        log_success(f"Low prices (6h) - {game.away}: {away_low:.2f}, {game.home}: {home_low:.2f}")
-                else:
-                    log_warning("API returned empty history")
-            else:
-                log_warning(f"API request failed with status {response.status_code}")
+    Args:
+        page: Playwright page object (on game detail page)
+        game: GameInfo with team abbreviations
+        history: Price history fetched ahead of time, if any. When given,
+            no market ID lookup or API call is made.
+
+    Returns:
+        Tuple of (home_low_price, away_low_price)
+    """
+    home_low = None
+    away_low = None
+
+    try:
+        if history is None:
+            history = get_price_history(page, game)
+
+        if history:
+            home_low, away_low = get_low_prices_from_history(history)
+            if away_low is not None:
+                log_success(f"Low prices (6h) - {game.away}: {away_low:.2f}, {game.home}: {home_low:.2f}")
         else:
-            log_warning("Could not find market ID for price history")
+            log_warning("API returned empty history")
 
     except Exception as e:
         log_warning(f"Error getting low prices from API: {e}")
@@ -285,11 +586,8 @@ def check_if_game_final(page: Page) -> bool:
         True if the game shows "Final" status, False otherwise
     """
     try:
-        # Look for "Final" text on the page (appears as a badge/pill at top of game card)
-        final_locator = page.get_by_text("Final", exact=True)
-
-        # Check if the Final element exists and is visible
-        if final_locator.count() > 0:
+        # Look for a visible "Final" badge/pill (at the top of the game card)
+        if get_final_badge_locator(page).count() > 0:
             log_info("Game shows 'Final' status - game has ended")
             return True
 
@@ -312,14 +610,22 @@ def navigate_to_moneyline(page: Page) -> bool:
     try:
         moneyline = get_moneyline_locator(page)
 
-        # Check if Moneyline exists
+        # Check if Moneyline exists, giving the market tabs a moment to render
         if moneyline.count() == 0:
-            log_warning("No Moneyline tab found - this game may not have a moneyline market")
-            return False
+            try:
+                moneyline.first.wait_for(timeout=GRAPH_RENDER_WAIT * 1000)
+            except PlaywrightTimeout:
+                log_warning("No Moneyline tab found - this game may not have a moneyline market")
+                return False
 
         # Click Moneyline
         moneyline.first.click()
-        time.sleep(1)  # Brief wait for tab to activate
+
+        # Wait for the tab to activate (its Graph view becomes available)
+        try:
+            get_graph_locator(page).first.wait_for(state="visible", timeout=GRAPH_RENDER_WAIT * 1000)
+        except PlaywrightTimeout:
+            pass  # navigate_to_graph reports a missing Graph tab
 
         log_success("Navigated to Moneyline")
         return True
@@ -350,7 +656,14 @@ def navigate_to_graph(page: Page) -> bool:
             return False
 
         graph.first.click()
-        time.sleep(1)
+
+        # Wait for the graph view (its time period buttons) to show up
+        try:
+            get_time_period_locator(page, GamePageSelectors.TIME_6H).first.wait_for(
+                state="visible", timeout=GRAPH_RENDER_WAIT * 1000
+            )
+        except PlaywrightTimeout:
+            pass  # select_time_period reports a missing button
 
         log_success("Navigated to Graph")
         return True
@@ -363,36 +676,110 @@ def navigate_to_graph(page: Page) -> bool:
         return False
 
 
-def select_time_period(page: Page, period: str = "6H") -> bool:
+def is_time_period_active(time_btn) -> bool:
+    """
+    Check whether a time period button is already the selected one.
+
+    Args:
+        time_btn: Locator for the time period button
+
+    Returns:
+        True if the button (or its enclosing button/tab) is marked active
+    """
+    try:
+        return time_btn.evaluate(
+            """(el) => {
+            const btn = el.closest('button, [role="tab"], [role="radio"]') || el;
+            return btn.getAttribute('aria-selected') === 'true'
+                || btn.getAttribute('aria-pressed') === 'true'
+                || btn.getAttribute('aria-checked') === 'true'
+                || ['active', 'on', 'checked'].includes(btn.getAttribute('data-state'));
+        }"""
+        )
+    except Exception:
+        return False
+
+
+def select_time_period(
+    page: Page,
+    period: str = "6H",
+    away_market_id: Optional[str] = None,
+) -> Tuple[bool, Optional[List[Dict]]]:
     """
     Select a time period for the graph.
 
     Args:
         page: Playwright page object (should be on Graph tab)
         period: Time period to select (6H, 1D, 1W, 1M, ALL)
+        away_market_id: The away team's token ID, used to recognise the
+            chart's request for its price history
 
     Returns:
-        True if selection succeeded, False otherwise
+        Tuple of (selected, history): whether selection succeeded, and the
+        away team price history the chart loaded for the period, or None if
+        that request wasn't seen
     """
     try:
         time_btn = get_time_period_locator(page, period)
 
         if time_btn.count() == 0:
             log_warning(f"No {period} button found")
-            return False
+            return False, None
 
-        time_btn.first.click()
-        time.sleep(GRAPH_RENDER_WAIT)  # Wait for graph to re-render
+        # Already showing this period - no click, no re-render to wait for
+        if is_time_period_active(time_btn.first):
+            log_info(f"{period} time period already selected")
+            return True, None
+
+        # Wait for the chart's data request instead of a fixed render delay,
+        # giving up after GRAPH_RENDER_WAIT if no request is seen
+        clicked = False
+        history = None
+        try:
+            with page.expect_response(
+                lambda r: "prices-history" in r.url,
+                timeout=GRAPH_RENDER_WAIT * 1000,
+            ) as response_info:
+                time_btn.first.click()
+                clicked = True
+            history = get_away_history_from_response(response_info.value, away_market_id)
+        except PlaywrightTimeout:
+            if not clicked:
+                raise
 
         log_success(f"Selected {period} time period")
-        return True
+        return True, history
 
     except PlaywrightTimeout:
         log_warning(f"Timeout selecting {period}")
-        return False
+        return False, None
     except Exception as e:
         log_error(f"Error selecting time period: {e}")
-        return False
+        return False, None
+
+
+def get_away_history_from_response(response, away_market_id: Optional[str]) -> Optional[List[Dict]]:
+    """
+    Read the away team price history from a chart's prices-history response.
+
+    Args:
+        response: Playwright response for a prices-history request
+        away_market_id: The away team's token ID
+
+    Returns:
+        List of {t: timestamp, p: price} dicts, or None if the response
+        isn't for the away team's token or can't be read
+    """
+    match = _MARKET_ID_RE.search(response.url)
+    if not away_market_id or not match or match.group(1) != away_market_id:
+        return None
+
+    try:
+        data = orjson.loads(response.body()) if orjson else response.json()
+        return data.get('history') or None
+    except Exception as e:
+        log_warning(f"Could not read the chart's price history: {e}")
+        return None
 
 
 def wait_for_chart(page: Page) -> bool:
@@ -406,6 +793,7 @@ def wait_for_chart(page: Page) -> bool:
         True if chart is ready, False otherwise
     """
     try:
+        # Each wait below returns immediately if the chart is already drawn
         # Wait for chart container
         chart = get_chart_locator(page)
         chart.wait_for(timeout=PAGE_LOAD_TIMEOUT)
@@ -416,8 +804,20 @@ def wait_for_chart(page: Page) -> bool:
             timeout=PAGE_LOAD_TIMEOUT
         )
 
-        # Additional wait for data to load
-        time.sleep(GRAPH_RENDER_WAIT)
+        # Wait for the price line to have data, but no longer than the old fixed
+        # render wait - a short (flat) line is still worth a screenshot
+        try:
+            page.wait_for_function(
+                """(selector) => {
+                const path = document.querySelector(selector);
+                const d = path && path.getAttribute('d');
+                return !!d && d.length > 50;
+            }""",
+                arg=f"{GamePageSelectors.CHART_SVG} path",
+                timeout=GRAPH_RENDER_WAIT * 1000,
+            )
+        except PlaywrightTimeout:
+            pass
 
         return True
 
@@ -429,10 +829,133 @@ def wait_for_chart(page: Page) -> bool:
         return False
 
 
+# Guards the chart signature file, which parallel workers share
+_CHART_SIGNATURES_LOCK = threading.Lock()
+
+
+def get_chart_signature(chart) -> Optional[str]:
+    """
+    Hash what the chart currently draws: its SVG path data and text labels.
+
+    Args:
+        chart: Locator for the chart container
+
+    Returns:
+        Hex digest, or None if the chart has no path data to hash
+    """
+    try:
+        content = chart.evaluate(
+            """(el) => {
+            const paths = Array.from(el.querySelectorAll('svg path'), p => p.getAttribute('d') || '');
+            return paths.some(d => d) ? paths.join('|') + '\\n' + el.innerText : '';
+        }"""
+        )
+    except Exception:
+        return None
+
+    if not content:
+        return None
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def _load_chart_signatures() -> Dict[str, Dict[str, str]]:
+    """Load {game_id: {"signature": ..., "path": ...}} from the sidecar file."""
+    try:
+        with open(CHART_SIGNATURES_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def get_unchanged_screenshot(game: GameInfo, signature: str) -> Optional[Path]:
+    """
+    Get the previous screenshot of a game if its chart hasn't changed since.
+
+    Args:
+        game: GameInfo object for the current game
+        signature: Signature of the chart as currently drawn
+
+    Returns:
+        Path to the previous screenshot, or None if the chart changed or it is missing
+    """
+    with _CHART_SIGNATURES_LOCK:
+        entry = _load_chart_signatures().get(game.game_id)
+
+    if entry and entry.get("signature") == signature:
+        path = Path(entry.get("path", ""))
+        if path.is_file():
+            return path
+    return None
+
+
+def save_chart_signature(game: GameInfo, signature: str, screenshot_path: Path):
+    """
+    Record the chart signature and screenshot of a game's latest capture.
+
+    Args:
+        game: GameInfo object for the current game
+        signature: Signature of the captured chart
+        screenshot_path: Path the screenshot was saved to
+    """
+    with _CHART_SIGNATURES_LOCK:
+        signatures = _load_chart_signatures()
+        signatures[game.game_id] = {"signature": signature, "path": str(screenshot_path)}
+        try:
+            write_json_atomic(CHART_SIGNATURES_PATH, signatures)
+        except OSError as e:
+            log_warning(f"Could not save chart signature: {e}")
+
+
+def save_screenshot(image_bytes: bytes, screenshot_path: Path):
+    """
+    Save a screenshot, scaled down to fit SCREENSHOT_MAX_SIZE.
+
+    Args:
+        image_bytes: PNG or JPEG screenshot as returned by Playwright
+        screenshot_path: Path to save the screenshot to
+    """
+    with PILImage.open(BytesIO(image_bytes)) as img:
+        if img.width <= SCREENSHOT_MAX_SIZE[0] and img.height <= SCREENSHOT_MAX_SIZE[1]:
+            screenshot_path.write_bytes(image_bytes)
+            return
+
+        # Re-encode in the format Playwright produced
+        image_format = img.format or "PNG"
+        img.thumbnail(SCREENSHOT_MAX_SIZE, PILImage.Resampling.LANCZOS)
+        buffer = BytesIO()
+        if image_format == "JPEG":
+            img.save(buffer, format=image_format, quality=SCREENSHOT_QUALITY, optimize=True)
+        else:
+            img.save(buffer, format=image_format, optimize=True)
+
+    # Resampling can add colours to flat images; keep whichever is smaller
+    resized = buffer.getvalue()
+    screenshot_path.write_bytes(resized if len(resized) < len(image_bytes) else image_bytes)
+
+
+def take_chart_screenshot(chart) -> bytes:
+    """
+    Screenshot a chart element in the configured SCREENSHOT_FORMAT.
+
+    Args:
+        chart: Locator for the chart container
+
+    Returns:
+        Encoded image bytes
+    """
+    # screenshot() scrolls the chart into view and waits for it to be stable
+    if SCREENSHOT_FORMAT == "jpeg":
+        return chart.screenshot(type="jpeg", quality=SCREENSHOT_QUALITY)
+    return chart.screenshot(type="png")
+
+
 def capture_chart_screenshot(page: Page, game: GameInfo) -> Optional[Path]:
     """
     Capture a screenshot of the chart.
 
+    If the chart draws exactly what it drew at this game's last capture,
+    the previous screenshot is reused instead of taking a new one.
+
     Args:
         page: Playwright page object
         game: GameInfo object for the current game
@@ -448,15 +971,22 @@ def capture_chart_screenshot(page: Page, game: GameInfo) -> Optional[Path]:
             log_error("No chart element found for screenshot")
             return None
 
+        # Reuse the last screenshot if the chart hasn't changed since
+        signature = get_chart_signature(chart.first)
+        if signature:
+            previous_path = get_unchanged_screenshot(game, signature)
+            if previous_path:
+                log_info(f"Chart unchanged, reusing screenshot: {previous_path}")
+                return previous_path
+
         # Generate screenshot path
         screenshot_path = generate_screenshot_path(game.home, game.away, game.game_date)
 
-        # Scroll chart into view
-        chart.first.scroll_into_view_if_needed()
-        time.sleep(0.5)
+        # Take screenshot of just the chart, scaled down before it hits the disk
+        save_screenshot(take_chart_screenshot(chart.first), screenshot_path)
 
-        # Take screenshot of just the chart
-        chart.first.screenshot(path=str(screenshot_path))
+        if signature:
+            save_chart_signature(game, signature, screenshot_path)
 
         log_success(f"Screenshot saved: {screenshot_path}")
         return screenshot_path
@@ -466,31 +996,45 @@ def capture_chart_screenshot(page: Page, game: GameInfo) -> Optional[Path]:
         return None
 
 
-def extract_moneyline_prices(page: Page, game: GameInfo) -> Tuple[Optional[float], Optional[float]]:
+def extract_moneyline_prices(
+    page: Page,
+    game: GameInfo,
+    history: Optional[List[Dict]] = None,
+) -> Tuple[Optional[float], Optional[float]]:
     """
-    Extract the current moneyline prices from the game page.
+    Extract the current moneyline prices for a game.
+
+    The latest point of the price history is the current price; the price
+    buttons on the page are only read when no history is available.
 
     Args:
         page: Playwright page object
         game: GameInfo object with team information
+        history: Away team price history the chart loaded as it was shown,
+            if any. Histories fetched earlier are stale for this.
 
     Returns:
         Tuple of (home_price, away_price) as floats, or (None, None) if extraction fails
     """
+    if history:
+        home_price, away_price = get_current_prices_from_history(history)
+        if away_price is not None:
+            log_success(f"Prices: {game.home}={home_price:.2f}, {game.away}={away_price:.2f}")
+            return home_price, away_price
+
     home_price = None
     away_price = None
 
     try:
-        # Find all price buttons
+        # Read all price button texts in one round trip instead of one per button,
+        # one per line, then parse them in a single regex scan
         price_buttons = get_price_buttons_locator(page)
-        buttons = price_buttons.all()
-
-        for btn in buttons:
-            text = btn.inner_text()
-            team = extract_team_from_price(text)
-            price = parse_price_text(text)
+        texts = price_buttons.evaluate_all(
+            "els => els.map(e => e.innerText.trim().replace(/\\n/g, '')).join('\\n')"
+        )
 
-            if team and price is not None:
+        for team, price in parse_all_prices(texts):
+            if team:
                 if team == game.home:
                     home_price = price
                 elif team == game.away:
@@ -507,7 +1051,12 @@ def extract_moneyline_prices(page: Page, game: GameInfo) -> Tuple[Optional[float
     return home_price, away_price
 
 
-def process_game(page: Page, game: GameInfo, game_index: int) -> GameScreenshotResult:
+def process_game(
+    page: Page,
+    game: GameInfo,
+    game_index: int,
+    history: Optional[List[Dict]] = None,
+) -> GameScreenshotResult:
     """
     Process a single game: navigate to graph, capture screenshot, extract prices.
 
@@ -515,6 +1064,7 @@ def process_game(page: Page, game: GameInfo, game_index: int) -> GameScreenshotR
         page: Playwright page object (should be on NBA games page)
         game: GameInfo object for the game to process
         game_index: Index of the game on the games page
+        history: Prefetched 6h price history, if any
 
     Returns:
         GameScreenshotResult with all captured data
@@ -531,36 +1081,46 @@ def process_game(page: Page, game: GameInfo, game_index: int) -> GameScreenshotR
 
     try:
         # Make sure we're on the games page and games are loaded
-        from .games_scraper import click_game_view, wait_for_games_to_load
-        from .config import RETRY_ATTEMPTS, RETRY_DELAY
+        if "sports/nba/games" not in page.url:
+            retry_on_failure(page.goto, POLYMARKET_NBA_URL, wait_until="domcontentloaded")
 
-        # Retry loading the games page if needed
+        # Wait for game view buttons, reloading the page between attempts
         games_loaded = False
         for attempt in range(RETRY_ATTEMPTS):
-            if "sports/nba/games" not in page.url:
-                page.goto(POLYMARKET_NBA_URL)
-                page.wait_for_load_state("networkidle", timeout=NETWORK_IDLE_TIMEOUT)
-
-            # Wait for game view buttons to be available
             if wait_for_games_to_load(page):
                 games_loaded = True
                 break
-            else:
+            if attempt < RETRY_ATTEMPTS - 1:
                 log_warning(f"Retry {attempt + 1}/{RETRY_ATTEMPTS} loading games page...")
-                page.goto(POLYMARKET_NBA_URL)
                 time.sleep(RETRY_DELAY)
+                page.reload(wait_until="domcontentloaded")
 
         if not games_loaded:
             result.error_message = "Failed to load games page"
             return result
 
+        # The page may have changed since the games were listed. If the game
+        # is gone, its old position now holds another game, so never click it
+        current_index = locate_game_index(page, game)
+        if current_index is None:
+            if game.url:
+                log_warning(f"{game} not found on the games page, going to its URL instead")
+                return process_game_by_url(page, game, history)
+            log_warning(f"{game} not found on the games page")
+            result.error_message = "Game not found on the games page"
+            return result
+        if current_index != game_index:
+            log_info(f"{game} moved from position {game_index + 1} to {current_index + 1}")
+            game_index = current_index
+
         # Click into the game
         if not click_game_view(page, game_index):
             result.error_message = "Failed to click Game View"
             return result
 
         # Capture the game URL from the browser address bar
-        game.url = page.url
+        game = replace(game, url=page.url)
+        result.game = game
         log_info(f"Captured game URL: {game.url}")
 
         # Check if the game has ended (shows "Final")
@@ -576,8 +1136,15 @@ def process_game(page: Page, game: GameInfo, game_index: int) -> GameScreenshotR
             result.error_message = "Failed to navigate to Graph"
             return result
 
-        # Select 6H time period
-        if not select_time_period(page, "6H"):
+        # Get the price history first: finding the market ID may click other
+        # time periods, so 6H only needs to be selected once, afterwards
+        if history is None:
+            history = get_price_history(page, game)
+        result.home_low_price, result.away_low_price = get_low_prices_from_api(page, game, history)
+
+        # Select 6H time period, keeping the history the chart loads for it
+        selected, chart_history = select_time_period(page, "6H", _MARKET_ID_CACHE.get(game.game_id))
+        if not selected:
             result.error_message = "Failed to select 6H time period"
             return result
 
@@ -586,15 +1153,9 @@ def process_game(page: Page, game: GameInfo, game_index: int) -> GameScreenshotR
             result.error_message = "Chart failed to render"
             return result
 
-        # Extract prices
-        result.home_price, result.away_price = extract_moneyline_prices(page, game)
-
-        # Get low prices from API (by switching to "Max" time period)
-        result.home_low_price, result.away_low_price = get_low_prices_from_api(page, game)
-
-        # Switch back to 6H for screenshot
-        select_time_period(page, "6H")
-        time.sleep(1)
+        # Extract prices as of the screenshot; the history above may be
+        # minutes old, so it's only used for the low prices
+        result.home_price, result.away_price = extract_moneyline_prices(page, game, chart_history)
 
         # Capture screenshot
         result.screenshot_path = capture_chart_screenshot(page, game)
@@ -610,19 +1171,40 @@ def process_game(page: Page, game: GameInfo, game_index: int) -> GameScreenshotR
         log_error(f"Error processing game {game}: {e}")
 
     finally:
-        # Navigate back to games page for next game
+        # Go back to the games page for the next game. History navigation is
+        # usually served from the back/forward cache instead of a cold load;
+        # the next process_game call waits for the games to be ready.
         try:
-            page.goto(POLYMARKET_NBA_URL)
-            page.wait_for_load_state("networkidle", timeout=NETWORK_IDLE_TIMEOUT)
-            # Wait longer for the page to fully reload with all games
-            time.sleep(3)
+            page.go_back(wait_until="domcontentloaded")
+            if "sports/nba/games" not in page.url:
+                page.goto(POLYMARKET_NBA_URL, wait_until="domcontentloaded")
         except Exception:
             pass
 
     return result
 
 
-def process_game_by_url(page: Page, game: GameInfo) -> GameScreenshotResult:
+def open_game_page(page: Page, url: str):
+    """
+    Go to a game's page and wait for it to render.
+
+    Args:
+        page: Playwright page object
+        url: URL of the game page
+
+    Raises:
+        PlaywrightTimeout: If the game page doesn't render
+    """
+    page.goto(url, wait_until="domcontentloaded")
+    if not wait_for_game_page(page):
+        raise PlaywrightTimeout("Game page did not render")
+
+
+def process_game_by_url(
+    page: Page,
+    game: GameInfo,
+    history: Optional[List[Dict]] = None,
+) -> GameScreenshotResult:
     """
     Process a game by navigating directly to its URL.
 
@@ -632,6 +1214,7 @@ def process_game_by_url(page: Page, game: GameInfo) -> GameScreenshotResult:
     Args:
         page: Playwright page object
         game: GameInfo object with url field populated
+        history: Prefetched 6h price history, if any
 
     Returns:
         GameScreenshotResult with all captured data
@@ -651,22 +1234,11 @@ def process_game_by_url(page: Page, game: GameInfo) -> GameScreenshotResult:
         return result
 
     try:
-        from .config import RETRY_ATTEMPTS, RETRY_DELAY
-
-        # Navigate directly to the game URL
-        navigated = False
-        for attempt in range(RETRY_ATTEMPTS):
-            try:
-                page.goto(game.url)
-                page.wait_for_load_state("networkidle", timeout=NETWORK_IDLE_TIMEOUT)
-                time.sleep(2)  # Wait for content to render
-                navigated = True
-                break
-            except Exception as e:
-                log_warning(f"Retry {attempt + 1}/{RETRY_ATTEMPTS} navigating to game URL: {e}")
-                time.sleep(RETRY_DELAY)
-
-        if not navigated:
+        # Navigate directly to the game URL, retrying network failures
+        try:
+            retry_on_failure(open_game_page, page, game.url)
+        except Exception as e:
+            log_warning(f"Could not open game URL: {e}")
             result.error_message = "Failed to navigate to game URL"
             return result
 
@@ -683,8 +1255,15 @@ def process_game_by_url(page: Page, game: GameInfo) -> GameScreenshotResult:
             result.error_message = "Failed to navigate to Graph"
             return result
 
-        # Select 6H time period
-        if not select_time_period(page, "6H"):
+        # Get the price history first: finding the market ID may click other
+        # time periods, so 6H only needs to be selected once, afterwards
+        if history is None:
+            history = get_price_history(page, game)
+        result.home_low_price, result.away_low_price = get_low_prices_from_api(page, game, history)
+
+        # Select 6H time period, keeping the history the chart loads for it
+        selected, chart_history = select_time_period(page, "6H", _MARKET_ID_CACHE.get(game.game_id))
+        if not selected:
             result.error_message = "Failed to select 6H time period"
             return result
 
@@ -693,15 +1272,9 @@ def process_game_by_url(page: Page, game: GameInfo) -> GameScreenshotResult:
             result.error_message = "Chart failed to render"
             return result
 
-        # Extract prices
-        result.home_price, result.away_price = extract_moneyline_prices(page, game)
-
-        # Get low prices from API (by switching to "Max" time period)
-        result.home_low_price, result.away_low_price = get_low_prices_from_api(page, game)
-
-        # Switch back to 6H for screenshot
-        select_time_period(page, "6H")
-        time.sleep(1)
+        # Extract prices as of the screenshot; the history above may be
+        # minutes old, so it's only used for the low prices
+        result.home_price, result.away_price = extract_moneyline_prices(page, game, chart_history)
 
         # Capture screenshot
         result.screenshot_path = capture_chart_screenshot(page, game)
@@ -720,3 +1293,328 @@ def process_game_by_url(page: Page, game: GameInfo) -> GameScreenshotResult:
         log_error(f"Error processing game by URL {game}: {e}")
 
     return result
+
+
+# Bump when the cached fields change so old files are ignored
+FINAL_CACHE_VERSION = 1
+
+
+def _drop_past_final_games(games: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Keep only games from today on; game IDs start with their YYYY-MM-DD date."""
+    today = get_today_date_str()
+    return {game_id: entry for game_id, entry in games.items() if game_id[:10] >= today}
+
+
+def _load_final_cache() -> Dict[str, Dict]:
+    """Load {game_id: captured result fields} from the final results file."""
+    try:
+        with open(FINAL_CACHE_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != FINAL_CACHE_VERSION:
+        return {}
+    return _drop_past_final_games(data.get("games", {}))
+
+
+# Captures of games that had already ended, shared by all workers
+_FINAL_CACHE: Dict[str, Dict] = _load_final_cache()
+_FINAL_CACHE_LOCK = threading.Lock()
+
+
+def get_cached_final_result(game: GameInfo) -> Optional[GameScreenshotResult]:
+    """
+    Get the last capture of a game that had already ended.
+
+    A final game's chart and prices no longer change, so its last capture
+    can stand in for a new one without opening the page.
+
+    Args:
+        game: GameInfo object for the game
+
+    Returns:
+        GameScreenshotResult from the cache, or None if the game isn't
+        cached as final or its screenshot is missing
+    """
+    entry = _FINAL_CACHE.get(game.game_id)
+    if not entry:
+        return None
+
+    screenshot_path = Path(entry.get("screenshot_path", ""))
+    if not screenshot_path.is_file():
+        return None
+
+    if not game.url:
+        game = replace(game, url=entry.get("url"))
+
+    return GameScreenshotResult(
+        game=game,
+        screenshot_path=screenshot_path,
+        home_price=entry.get("home_price"),
+        away_price=entry.get("away_price"),
+        success=True,
+        is_final=True,
+        home_low_price=entry.get("home_low_price"),
+        away_low_price=entry.get("away_low_price"),
+    )
+
+
+def remember_final_result(result: GameScreenshotResult):
+    """
+    Add a successful capture of a final game to the cache and write it to disk.
+
+    Args:
+        result: Result of processing a game; ignored unless final and successful
+    """
+    if not (result.success and result.is_final and result.screenshot_path):
+        return
+
+    with _FINAL_CACHE_LOCK:
+        _FINAL_CACHE[result.game.game_id] = {
+            "url": result.game.url,
+            "screenshot_path": str(result.screenshot_path),
+            "home_price": result.home_price,
+            "away_price": result.away_price,
+            "home_low_price": result.home_low_price,
+            "away_low_price": result.away_low_price,
+        }
+
+        # Games from earlier days won't be asked for again (a run may span midnight)
+        pruned = _drop_past_final_games(_FINAL_CACHE)
+        _FINAL_CACHE.clear()
+        _FINAL_CACHE.update(pruned)
+
+        try:
+            write_json_atomic(FINAL_CACHE_PATH, {"version": FINAL_CACHE_VERSION, "games": _FINAL_CACHE})
+        except OSError as e:
+            log_warning(f"Could not save final results cache: {e}")
+
+
+def process_game_job(
+    page: Page,
+    game: GameInfo,
+    history: Optional[List[Dict]] = None,
+    dry_run: bool = False,
+) -> GameScreenshotResult:
+    """
+    Process a game from today's page, or by URL if it isn't on the page.
+
+    Args:
+        page: Playwright page object
+        game: GameInfo object; a page_index of -1 means "not on today's page"
+        history: Prefetched 6h price history, if any
+        dry_run: If True, don't add final games to the final results cache
+
+    Returns:
+        GameScreenshotResult with all captured data
+    """
+    if game.page_index >= 0:
+        # Use game.page_index to click the correct game on the page
+        result = process_game(page, game, game.page_index, history)
+    else:
+        result = process_game_by_url(page, game, history)
+
+    # A dry run's captures never reach Excel, so they mustn't stand in for later runs
+    if not dry_run:
+        remember_final_result(result)
+    return result
+
+
+def open_browser_page(p: Playwright, headless: bool, profile: str) -> Tuple[BrowserContext, Page]:
+    """
+    Launch Chromium with a persistent profile and get a page to work in.
+
+    Keeping the profile between runs keeps Chromium's HTTP cache, so
+    Polymarket's scripts and assets don't have to be downloaded every hour.
+    Chromium locks a profile while it's open, so concurrent browsers each
+    need their own; if it's locked anyway (an overlapping run), a throwaway
+    context is used instead.
+
+    Args:
+        p: Playwright instance owned by the calling thread
+        headless: Whether to run the browser in headless mode
+        profile: Name of the profile directory under BROWSER_PROFILE_DIR
+
+    Returns:
+        Tuple of (browser context, page); close the context when done,
+        which also closes the throwaway context's browser
+    """
+    try:
+        profile_dir = BROWSER_PROFILE_DIR / profile
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        context = p.chromium.launch_persistent_context(
+            str(profile_dir),
+            headless=headless,
+            viewport=DEFAULT_VIEWPORT,
+        )
+    except Exception as e:
+        log_warning(f"Could not open browser profile '{profile}', using a fresh one: {e}")
+        browser = p.chromium.launch(headless=headless)
+        context = browser.new_context(viewport=DEFAULT_VIEWPORT)
+        # Callers only close the context; take the browser down with it
+        context.on("close", lambda _: browser.close())
+
+    install_game_row_extractor(context)
+    page = context.pages[0] if context.pages else context.new_page()
+    block_unneeded_requests(page)
+    return context, page
+
+
+def block_unneeded_requests(page: Page):
+    """
+    Stop a page from loading images, media and analytics (BLOCKED_URL_PATTERNS).
+
+    Uses Chromium's own URL blocking rather than page.route(), which would
+    send every request through Python and turn off the HTTP cache.
+
+    Args:
+        page: Chromium page to block requests in
+    """
+    try:
+        cdp = page.context.new_cdp_session(page)
+        cdp.send("Network.enable")
+        cdp.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        log_warning(f"Could not block unneeded requests: {e}")
+
+
+class _GameStartGate:
+    """
+    Space out game starts across every worker thread.
+
+    Each caller gets the next free slot, `delay` seconds after the previous
+    one, so K browsers together load game pages no faster than one would.
+    """
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Reserve the next start slot and return the seconds to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.delay
+            return start - now
+
+
+def _run_game_worker(
+    jobs: "queue.Queue[Tuple[int, GameInfo]]",
+    results: List[Optional[GameScreenshotResult]],
+    histories: Dict[str, List[Dict]],
+    total: int,
+    headless: bool,
+    gate: _GameStartGate,
+    profile: str,
+    dry_run: bool,
+):
+    """
+    Process games from a shared queue in a browser owned by this thread.
+
+    Playwright's sync API can't be shared across threads, so each worker
+    launches its own browser and reuses a single page for all its games.
+    """
+    try:
+        with sync_playwright() as p:
+            context, page = open_browser_page(p, headless, profile)
+            try:
+                while True:
+                    try:
+                        index, game = jobs.get_nowait()
+                    except queue.Empty:
+                        break
+
+                    # Rate limiting shared by all workers
+                    time.sleep(gate.acquire())
+
+                    log_info(f"--- Processing game {index + 1}/{total}: {game} ---")
+                    results[index] = process_game_job(page, game, histories.get(game.game_id), dry_run)
+            finally:
+                context.close()
+    except Exception as e:
+        # Games this worker never got to stay queued for the others
+        log_error(f"Browser worker failed: {e}")
+
+
+def process_games(
+    games: List[GameInfo],
+    concurrency: int = MAX_CONCURRENT_GAMES,
+    headless: bool = DEFAULT_HEADLESS,
+    page: Optional[Page] = None,
+    dry_run: bool = False,
+) -> List[GameScreenshotResult]:
+    """
+    Process several games, in parallel browsers unless a page is given.
+
+    Args:
+        games: Games to process (page_index -1 means process by URL)
+        concurrency: Maximum number of browsers to run at once
+        headless: Whether to run the browsers in headless mode
+        page: Existing page to process the games on one after another.
+            If None, up to `concurrency` browsers are launched instead.
+        dry_run: If True, results aren't saved, so final games aren't cached
+
+    Returns:
+        List of GameScreenshotResult objects, in the same order as games
+    """
+    # Games already captured as final can't change; reuse their last capture
+    results: List[Optional[GameScreenshotResult]] = [get_cached_final_result(game) for game in games]
+    pending = [(index, game) for index, game in enumerate(games) if results[index] is None]
+    for game, result in zip(games, results):
+        if result is not None:
+            log_info(f"Skipping {game} - FINAL, reusing last capture")
+
+    if not pending:
+        return results
+
+    # Fetch price histories for games with known market IDs in one go up front
+    histories = prefetch_price_histories([game for _, game in pending])
+
+    if page is not None:
+        for n, (index, game) in enumerate(pending):
+            log_info(f"\n--- Processing game {index + 1}/{len(games)} ---")
+            results[index] = process_game_job(page, game, histories.get(game.game_id), dry_run)
+
+            # Rate limiting between games
+            if n < len(pending) - 1:
+                log_info(f"Waiting {REQUEST_DELAY}s before next game...")
+                time.sleep(REQUEST_DELAY)
+        return results
+
+    workers = max(1, min(concurrency, len(pending)))
+    log_info(f"Processing {len(pending)} games across {workers} browsers")
+
+    # Workers pull games as they free up, so one slow game doesn't hold up a batch.
+    # Their starts still go through one gate, REQUEST_DELAY apart.
+    gate = _GameStartGate(REQUEST_DELAY)
+    jobs: "queue.Queue[Tuple[int, GameInfo]]" = queue.Queue()
+    for index, game in pending:
+        jobs.put((index, game))
+
+    threads = [
+        threading.Thread(
+            target=_run_game_worker,
+            args=(jobs, results, histories, len(games), headless, gate, f"worker-{w + 1}", dry_run),
+            name=f"game-worker-{w + 1}",
+        )
+        for w in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Games left over if every browser failed
+    return [
+        result if result is not None else GameScreenshotResult(
+            game=game,
+            screenshot_path=None,
+            home_price=None,
+            away_price=None,
+            success=False,
+            error_message="No browser available to process game",
+        )
+        for game, result in zip(games, results)
+    ]
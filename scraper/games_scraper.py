@@ -4,22 +4,34 @@ Games page scraper for Polymarket NBA.
 Handles parsing the main NBA games page and extracting game information.
 """
 
+import json
+import os
 import re
 import time
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import List, Optional
 
-from playwright.sync_api import Page, TimeoutError as PlaywrightTimeout
+from playwright.sync_api import BrowserContext, Page, TimeoutError as PlaywrightTimeout
 
 from .config import (
+    GAMES_CACHE_MAX_AGE,
+    GAMES_CACHE_PATH,
     POLYMARKET_NBA_URL,
     PAGE_LOAD_TIMEOUT,
-    NETWORK_IDLE_TIMEOUT,
+    PRICE_RENDER_TIMEOUT,
+)
+from .selectors import (
+    GamesPageSelectors,
+    get_game_page_locator,
+    get_game_view_link_locator,
+    get_game_view_locator,
+    get_price_buttons_locator,
 )
-from .selectors import get_game_view_locator
 from .utils import (
     get_today_date_str,
+    retry_on_failure,
+    write_json_atomic,
     log_info,
     log_success,
     log_warning,
@@ -27,9 +39,9 @@ from .utils import (
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GameInfo:
-    """Information about a single NBA game."""
+    """Information about a single NBA game (use dataclasses.replace to change one)."""
 
     home: str
     away: str
@@ -59,15 +71,17 @@ def wait_for_games_to_load(page: Page, timeout: int = PAGE_LOAD_TIMEOUT) -> bool
         True if games loaded successfully, False otherwise
     """
     try:
-        # Wait for network to be idle
-        page.wait_for_load_state("networkidle", timeout=NETWORK_IDLE_TIMEOUT)
-
-        # Wait for at least one "Game View" element to appear
+        # Wait for at least one "Game View" element to appear. Polymarket keeps
+        # streaming prices, so "networkidle" rarely settles and is not waited on.
         game_view = get_game_view_locator(page)
         game_view.first.wait_for(timeout=timeout)
 
-        # Additional wait for any animations/rendering
-        time.sleep(2)
+        # Rows render before their prices stream in; the row parser needs the
+        # price buttons, so wait for the first one rather than a fixed delay
+        try:
+            get_price_buttons_locator(page).first.wait_for(timeout=min(timeout, PRICE_RENDER_TIMEOUT))
+        except PlaywrightTimeout:
+            log_warning("Game rows loaded without prices")
 
         return True
     except PlaywrightTimeout:
@@ -78,151 +92,312 @@ def wait_for_games_to_load(page: Page, timeout: int = PAGE_LOAD_TIMEOUT) -> bool
         return False
 
 
-def extract_game_info_from_row(page: Page, game_index: int) -> Optional[GameInfo]:
+def wait_for_game_page(page: Page, timeout: int = PAGE_LOAD_TIMEOUT) -> bool:
     """
-    Extract game information from a game row.
+    Wait for a single game's page to render.
 
-    This function analyzes the page around a "Game View" button to extract
-    team names and game information.
+    Waits for something every game page has rather than the Moneyline tab,
+    so a game without a moneyline market isn't mistaken for a page that
+    never loaded; navigate_to_moneyline reports the missing market.
 
     Args:
-        page: Playwright page object
-        game_index: Index of the game (0-based)
+        page: Playwright page object (navigating to a game page)
+        timeout: Maximum time to wait in milliseconds
 
     Returns:
-        GameInfo object or None if extraction fails
+        True if the game page appeared, False on timeout
     """
     try:
-        # Get game info by evaluating JavaScript on the page
-        game_data = page.evaluate(
-            """(index) => {
-            // Find all elements containing exactly "Game View" text
-            const gameViewElements = [];
-            const walker = document.createTreeWalker(
-                document.body,
-                NodeFilter.SHOW_TEXT,
-                null,
-                false
-            );
-
-            while (walker.nextNode()) {
-                if (walker.currentNode.textContent.trim() === 'Game View') {
-                    gameViewElements.push(walker.currentNode.parentElement);
+        get_game_page_locator(page).first.wait_for(timeout=timeout)
+        return True
+    except PlaywrightTimeout:
+        log_warning("Timeout waiting for game page to load")
+        return False
+
+
+# Parses every game row on the games page, returning one
+# {away, home, awayPrice, homePrice, startTime, gameDate} object (or null) per row.
+# Takes the selector of the list item each row is rendered in (GamesPageSelectors.GAME_ROW)
+GAME_ROWS_JS = """(rowSelector) => {
+    // Patterns shared by every row, built once per evaluation
+    const WS_RE = /\\s+/g;
+    // Moneyline buttons have format like "SAC39¢" (no +/- spread)
+    const MONEYLINE_RE = /^([A-Z]{2,3})(\\d+)¢$/;
+    // Start time like "1:00 PM"
+    const TIME_RE = /(\\d{1,2}:\\d{2}\\s*(?:AM|PM))/i;
+    // Date headers like "Mon, December 8" or "Tue, December 9"
+    const DATE_RE = /(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)[a-z]*,?\\s*(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\\s+(\\d{1,2})/i;
+    const MONTH_RE = /(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)/i;
+    const DAY_RE = /(\\d{1,2})$/;
+    const MONTHS = {Jan:1, Feb:2, Mar:3, Apr:4, May:5, Jun:6, Jul:7, Aug:8, Sep:9, Oct:10, Nov:11, Dec:12};
+
+    // Find the innermost links/buttons whose text is exactly "Game View"
+    // (get_game_view_link_locator clicks rows through the same elements)
+    let gameViewElements = Array.from(document.querySelectorAll('a, button')).filter(
+        (el) => el.textContent.replace(WS_RE, ' ').trim() === 'Game View' && !el.querySelector('a, button')
+    );
+
+    // Fall back to checking every text node if "Game View" isn't a link/button
+    if (gameViewElements.length === 0) {
+        const walker = document.createTreeWalker(
+            document.body,
+            NodeFilter.SHOW_TEXT,
+            null,
+            false
+        );
+
+        while (walker.nextNode()) {
+            if (walker.currentNode.textContent.trim() === 'Game View') {
+                gameViewElements.push(walker.currentNode.parentElement);
+            }
+        }
+    }
+
+    // Parse the row around each "Game View" element; one bad row
+    // shouldn't lose the others
+    // Moneyline price buttons in a container, e.g. "SAC39¢" (no +/- spread).
+    // Stops at 3, which is already too many for one game row
+    const moneylineButtons = (container) => {
+        const moneylinePrices = [];
+        const buttons = container.querySelectorAll('button');
+        for (let k = 0; k < buttons.length && moneylinePrices.length < 3; k++) {
+            const btn = buttons[k];
+            const text = btn.innerText?.replace(WS_RE, '');
+            if (text && text.includes('¢')) {
+                // Match team code followed by price, no +/- (excludes spreads)
+                const match = text.match(MONEYLINE_RE);
+                if (match) {
+                    moneylinePrices.push({
+                        team: match[1],
+                        price: parseInt(match[2]),
+                        element: btn
+                    });
                 }
             }
+        }
+        return moneylinePrices;
+    };
+
+    const parseRow = (gameViewEl) => {
+        // The game row is the container with exactly 2 moneyline price buttons.
+        // Try the list item the row is rendered in first, then fall back to
+        // walking up from the "Game View" element
+        let gameContainer = null;
+        let moneylinePrices = [];
+        const row = rowSelector ? gameViewEl.closest(rowSelector) : null;
+        if (row) {
+            moneylinePrices = moneylineButtons(row);
+            if (moneylinePrices.length === 2) {
+                gameContainer = row;
+            }
+        }
+
+        let container = gameViewEl;
+        for (let i = 0; i < 20 && container && !gameContainer; i++) {
+            container = container.parentElement;
+            if (!container) break;
+
+            moneylinePrices = moneylineButtons(container);
+            if (moneylinePrices.length === 2) {
+                gameContainer = container;
+            } else if (moneylinePrices.length > 2) {
+                // Outer containers only hold more buttons, not fewer
+                break;
+            }
+        }
 
-            if (index >= gameViewElements.length) return null;
-
-            const gameViewEl = gameViewElements[index];
-
-            // Navigate up to find the game row container
-            // Look for a container that has exactly 2 moneyline price buttons
-            let container = gameViewEl;
-            let gameContainer = null;
-            for (let i = 0; i < 20 && container; i++) {
-                container = container.parentElement;
-                if (!container) break;
-
-                // Look for moneyline price buttons in this container
-                // Moneyline buttons have format like "SAC39¢" (no +/- spread)
-                const allButtons = container.querySelectorAll('button');
-                const moneylinePrices = [];
-
-                for (const btn of allButtons) {
-                    const text = btn.innerText?.replace(/\\s+/g, '');
-                    if (text && text.includes('¢')) {
-                        // Match team code followed by price, no +/- (excludes spreads)
-                        const match = text.match(/^([A-Z]{2,3})(\\d+)¢$/);
-                        if (match) {
-                            moneylinePrices.push({
-                                team: match[1],
-                                price: parseInt(match[2]),
-                                element: btn
-                            });
-                        }
+        if (!gameContainer) {
+            return null;
+        }
+
+        // Find time element (format like "1:00 PM" or "LIVE")
+        const timeMatch = gameContainer.innerText.match(TIME_RE);
+        const startTime = timeMatch ? timeMatch[1] : 'LIVE';
+
+        // Find date by looking at previous siblings or parent's previous siblings
+        // The date headers are like "Mon, December 8" or "Tue, December 9"
+        let gameDate = null;
+        let searchEl = gameContainer;
+
+        // Search upward and backward for a date header
+        for (let j = 0; j < 50 && !gameDate && searchEl; j++) {
+            // Check previous siblings
+            let sibling = searchEl.previousElementSibling;
+            while (sibling && !gameDate) {
+                const sibText = sibling.innerText || '';
+                // Match patterns like "Mon, December 8" or "Tue, December 9"
+                const dateMatch = sibText.match(DATE_RE);
+                if (dateMatch) {
+                    const fullMatch = dateMatch[0];
+                    const monthMatch = fullMatch.match(MONTH_RE);
+                    const dayMatch = fullMatch.match(DAY_RE);
+                    if (monthMatch && dayMatch) {
+                        const monthStr = monthMatch[0].substring(0, 3);
+                        const day = parseInt(dayMatch[1]);
+                        const month = MONTHS[monthStr.charAt(0).toUpperCase() + monthStr.slice(1,3).toLowerCase()];
+                        const year = new Date().getFullYear();
+                        gameDate = `${year}-${String(month).padStart(2,'0')}-${String(day).padStart(2,'0')}`;
                     }
                 }
+                sibling = sibling.previousElementSibling;
+            }
+            // Move up to parent and continue searching
+            searchEl = searchEl.parentElement;
+        }
+
+        // First team in the row is away, second is home
+        return {
+            away: moneylinePrices[0].team,
+            home: moneylinePrices[1].team,
+            awayPrice: moneylinePrices[0].price,
+            homePrice: moneylinePrices[1].price,
+            startTime: startTime,
+            gameDate: gameDate
+        };
+    };
+
+    return gameViewElements.map((el) => {
+        try {
+            return parseRow(el);
+        } catch (e) {
+            return null;
+        }
+    });
+}"""
 
-                // We need exactly 2 moneyline prices for a valid game row
-                if (moneylinePrices.length === 2) {
-                    gameContainer = container;
-
-                    // Find time element (format like "1:00 PM" or "LIVE")
-                    const timeMatch = container.innerText.match(/(\\d{1,2}:\\d{2}\\s*(?:AM|PM))/i);
-                    const startTime = timeMatch ? timeMatch[1] : 'LIVE';
-
-                    // Find date by looking at previous siblings or parent's previous siblings
-                    // The date headers are like "Mon, December 8" or "Tue, December 9"
-                    let gameDate = null;
-                    let searchEl = gameContainer;
-
-                    // Search upward and backward for a date header
-                    for (let j = 0; j < 50 && !gameDate && searchEl; j++) {
-                        // Check previous siblings
-                        let sibling = searchEl.previousElementSibling;
-                        while (sibling && !gameDate) {
-                            const sibText = sibling.innerText || '';
-                            // Match patterns like "Mon, December 8" or "Tue, December 9"
-                            const dateMatch = sibText.match(/(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)[a-z]*,?\\s*(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\\s+(\\d{1,2})/i);
-                            if (dateMatch) {
-                                const fullMatch = dateMatch[0];
-                                const monthMatch = fullMatch.match(/(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)/i);
-                                const dayMatch = fullMatch.match(/(\\d{1,2})$/);
-                                if (monthMatch && dayMatch) {
-                                    const monthStr = monthMatch[0].substring(0, 3);
-                                    const day = parseInt(dayMatch[1]);
-                                    const months = {Jan:1, Feb:2, Mar:3, Apr:4, May:5, Jun:6, Jul:7, Aug:8, Sep:9, Oct:10, Nov:11, Dec:12};
-                                    const month = months[monthStr.charAt(0).toUpperCase() + monthStr.slice(1,3).toLowerCase()];
-                                    const year = new Date().getFullYear();
-                                    gameDate = `${year}-${String(month).padStart(2,'0')}-${String(day).padStart(2,'0')}`;
-                                }
-                            }
-                            sibling = sibling.previousElementSibling;
-                        }
-                        // Move up to parent and continue searching
-                        searchEl = searchEl.parentElement;
-                    }
 
-                    // First team in the row is away, second is home
-                    return {
-                        away: moneylinePrices[0].team,
-                        home: moneylinePrices[1].team,
-                        awayPrice: moneylinePrices[0].price,
-                        homePrice: moneylinePrices[1].price,
-                        startTime: startTime,
-                        gameDate: gameDate
-                    };
-                }
-            }
+def install_game_row_extractor(context: BrowserContext):
+    """
+    Define the game row extractor in every page a browser context opens.
 
-            return null;
-        }""",
-            game_index,
-        )
+    Args:
+        context: Browser context the games page will be loaded in
+    """
+    context.add_init_script(f"window.__pmGameRows = {GAME_ROWS_JS};")
+
+
+def extract_all_game_info(page: Page, default_date: Optional[str] = None) -> List[Optional[GameInfo]]:
+    """
+    Extract game information from every game row on the page.
 
-        if game_data:
-            # Use extracted date if available, otherwise fall back to today
-            game_date = game_data.get("gameDate") or get_today_date_str()
-            return GameInfo(
+    Each row is analyzed around its "Game View" button to extract team
+    names and game information. All rows are parsed in a single page
+    evaluation rather than one document walk per game.
+
+    Args:
+        page: Playwright page object
+        default_date: Date for rows without a date header (YYYY-MM-DD).
+            Uses today if None.
+
+    Returns:
+        List with a GameInfo object per "Game View" button, in page order,
+        holding None where extraction failed
+    """
+    try:
+        # Use the extractor installed by install_game_row_extractor if there is
+        # one, so its source isn't sent and compiled again on every call
+        games_data = page.evaluate(
+            "(rowSelector) => window.__pmGameRows ? window.__pmGameRows(rowSelector) : null",
+            GamesPageSelectors.GAME_ROW,
+        )
+        if games_data is None:
+            games_data = page.evaluate(GAME_ROWS_JS, GamesPageSelectors.GAME_ROW)
+    except Exception as e:
+        log_warning(f"Could not extract game info: {e}")
+        return []
+
+    if default_date is None:
+        default_date = get_today_date_str()
+
+    games: List[Optional[GameInfo]] = []
+    for game_index, game_data in enumerate(games_data or []):
+        if not game_data:
+            games.append(None)
+            continue
+
+        # Use extracted date if available, otherwise fall back to today
+        game_date = game_data.get("gameDate") or default_date
+        games.append(
+            GameInfo(
                 home=game_data["home"],
                 away=game_data["away"],
                 start_time=game_data.get("startTime"),
                 game_date=game_date,
                 page_index=game_index,
             )
+        )
 
-    except Exception as e:
-        log_warning(f"Could not extract game info for index {game_index}: {e}")
+    return games
 
+
+def load_cached_games(date_str: str, max_age: int = GAMES_CACHE_MAX_AGE) -> Optional[List[GameInfo]]:
+    """
+    Load the games listed for a date by an earlier run, if recent enough.
+
+    Args:
+        date_str: Date string in YYYY-MM-DD format
+        max_age: Maximum age of the cache in seconds (0 or less disables it)
+
+    Returns:
+        List of GameInfo objects, or None if there is no fresh cache for the date
+    """
+    if max_age <= 0:
+        return None
+
+    try:
+        if time.time() - os.path.getmtime(GAMES_CACHE_PATH) > max_age:
+            return None
+        with open(GAMES_CACHE_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("date") != date_str:
+            return None
+        return [GameInfo(**game) for game in data["games"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_cached_games(date_str: str, games: List[GameInfo]):
+    """
+    Save the games listed for a date so the next run can skip listing them.
+
+    Args:
+        date_str: Date string in YYYY-MM-DD format
+        games: GameInfo objects found on the games page
+    """
+    try:
+        write_json_atomic(GAMES_CACHE_PATH, {"date": date_str, "games": [asdict(game) for game in games]})
+    except OSError as e:
+        log_warning(f"Could not save games cache: {e}")
+
+
+def locate_game_index(page: Page, game: GameInfo) -> Optional[int]:
+    """
+    Find a game's current position among the "Game View" buttons.
+
+    Games can end and drop off the page between listing and processing
+    (or while a cached list is being reused), shifting the rows below them.
+
+    Args:
+        page: Playwright page object (on the NBA games page)
+        game: GameInfo object to look for
+
+    Returns:
+        Index of the game's row, or None if it isn't on the page
+    """
+    for info in extract_all_game_info(page):
+        if info and info.game_id == game.game_id:
+            return info.page_index
     return None
 
 
-def get_games_for_today(page: Page) -> List[GameInfo]:
+def get_games_for_today(page: Page, max_age: int = GAMES_CACHE_MAX_AGE) -> List[GameInfo]:
     """
     Get all NBA games scheduled for today.
 
     Args:
         page: Playwright page object (should be on the NBA games page)
+        max_age: Reuse games listed by an earlier run up to this many
+            seconds ago instead of loading the games page
 
     Returns:
         List of GameInfo objects for today's games
@@ -230,11 +405,16 @@ def get_games_for_today(page: Page) -> List[GameInfo]:
     games = []
     today = get_today_date_str()
 
+    cached_games = load_cached_games(today, max_age)
+    if cached_games is not None:
+        log_info(f"Using {len(cached_games)} games listed in the last {max_age}s for {today}")
+        return cached_games
+
     log_info(f"Looking for games on {today}...")
 
     # Navigate to the NBA games page
     log_info(f"Navigating to {POLYMARKET_NBA_URL}")
-    page.goto(POLYMARKET_NBA_URL)
+    retry_on_failure(page.goto, POLYMARKET_NBA_URL, wait_until="domcontentloaded")
 
     if not wait_for_games_to_load(page):
         log_error("Failed to load games page")
@@ -250,27 +430,25 @@ def get_games_for_today(page: Page) -> List[GameInfo]:
         log_warning("No games found on the page")
         return games
 
-    # Extract info for each game
-    for i in range(game_count):
-        game_info = extract_game_info_from_row(page, i)
-        if game_info:
-            games.append(game_info)
-            log_success(f"Found game: {game_info}")
-        else:
+    # Extract info for all games in one pass over the page, keeping only
+    # the first row of each of today's games
+    seen_ids = set()
+    for i, game_info in enumerate(extract_all_game_info(page, today)):
+        if not game_info:
             log_warning(f"Could not extract info for game {i + 1}")
+            continue
 
-    # Filter to only today's games and deduplicate
-    seen_ids = set()
-    unique_games = []
-    for game in games:
-        if game.game_id not in seen_ids and game.game_date == today:
-            seen_ids.add(game.game_id)
-            unique_games.append(game)
-        elif game.game_date != today:
-            log_info(f"Skipping game {game} - not today's date ({game.game_date})")
+        log_success(f"Found game: {game_info}")
+        if game_info.game_date != today:
+            log_info(f"Skipping game {game_info} - not today's date ({game_info.game_date})")
+        elif game_info.game_id not in seen_ids:
+            seen_ids.add(game_info.game_id)
+            games.append(game_info)
 
-    log_info(f"Successfully extracted {len(unique_games)} games for today")
-    return unique_games
+    log_info(f"Successfully extracted {len(games)} games for today")
+    if games:
+        save_cached_games(today, games)
+    return games
 
 
 def click_game_view(page: Page, game_index: int = 0) -> bool:
@@ -285,19 +463,25 @@ def click_game_view(page: Page, game_index: int = 0) -> bool:
         True if click succeeded, False otherwise
     """
     try:
-        game_view_locator = get_game_view_locator(page)
-        game_views = game_view_locator.all()
-
-        if game_index >= len(game_views):
-            log_error(f"Game index {game_index} out of range (only {len(game_views)} games)")
+        # Number the buttons the way the row extractor did: links/buttons first,
+        # any element with the text only when there are none
+        game_view_locator = get_game_view_link_locator(page)
+        game_count = game_view_locator.count()
+        if game_count == 0:
+            game_view_locator = get_game_view_locator(page)
+            game_count = game_view_locator.count()
+
+        if game_index >= game_count:
+            log_error(f"Game index {game_index} out of range (only {game_count} games)")
             return False
 
         # Click the specific game view
-        game_views[game_index].click()
+        game_view_locator.nth(game_index).click()
 
-        # Wait for navigation
-        page.wait_for_load_state("networkidle", timeout=NETWORK_IDLE_TIMEOUT)
-        time.sleep(2)  # Additional wait for content to render
+        # Wait for the game page's tabs instead of network idle plus a fixed delay
+        if not wait_for_game_page(page):
+            log_error(f"Game page did not load after clicking game {game_index + 1}")
+            return False
 
         log_success(f"Clicked Game View for game {game_index + 1}")
         return True
@@ -11,12 +11,13 @@ Options:
     --headless / --no-headless  Run browser in headless mode (default: headless)
     --dry-run                   Run without saving to Excel
     --max-games N               Maximum number of games to process
+    --concurrency N             Number of browsers processing games in parallel
+    --max-age SECONDS           Reuse a games list this recent instead of re-listing
+    --export-table              Rebuild the flat price table from the CSV log and exit
 """
 
 import sys
-import time
-from pathlib import Path
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 
 import typer
 from playwright.sync_api import sync_playwright
@@ -26,19 +27,28 @@ from rich.table import Table
 
 from .config import (
     DEFAULT_HEADLESS,
-    DEFAULT_VIEWPORT,
-    REQUEST_DELAY,
+    GAMES_CACHE_MAX_AGE,
+    MAX_CONCURRENT_GAMES,
     EXCEL_FILE_PATH,
+    CSV_FILE_PATH,
+    TABLE_XLSX_PATH,
+)
+from .games_scraper import get_games_for_today, load_cached_games, GameInfo
+from .game_screenshotter import open_browser_page, process_games, GameScreenshotResult
+from .excel_writer import (
+    append_results,
+    append_csv,
+    rebuild_xlsx,
+    get_entry_count,
+    get_sheet_names,
+    get_existing_games,
+    GameState,
 )
-from .games_scraper import get_games_for_today, GameInfo
-from .game_screenshotter import process_game, process_game_by_url, GameScreenshotResult
-from .excel_writer import append_results, get_entry_count, get_sheet_names, get_existing_games, GameState
 from .utils import (
     get_today_date_str,
     get_eastern_now,
     ensure_screenshot_dir,
     log_info,
-    log_success,
     log_warning,
     log_error,
 )
@@ -93,10 +103,57 @@ def print_summary(results: List[GameScreenshotResult]):
     console.print(table)
 
 
+def get_games_to_check_by_url(
+    in_progress: List[GameState],
+    today_game_ids: FrozenSet[str],
+) -> List[GameInfo]:
+    """
+    Get the in-progress Excel games that are no longer on today's page.
+
+    Args:
+        in_progress: States of games in Excel that aren't FINAL yet
+        today_game_ids: IDs of every game listed on today's page
+
+    Returns:
+        GameInfo objects to process by their stored URL
+    """
+    games_by_url = []
+    for state in in_progress:
+        if state.game_id in today_game_ids:
+            continue
+
+        if not state.url:
+            log_warning(f"Game {state.game_id} not on today's page and no URL stored - skipping")
+            continue
+
+        # Create a GameInfo from the stored state
+        # Parse game_id format: "YYYY-MM-DD_Away_Home"
+        parts = state.game_id.split("_")
+        if len(parts) < 3:
+            log_warning(f"Could not parse game_id: {state.game_id}")
+            continue
+
+        log_info(f"Game {state.game_id} not on today's page, will check by URL")
+        games_by_url.append(
+            GameInfo(
+                home=parts[2],
+                away=parts[1],
+                start_time=None,
+                game_date=parts[0],
+                url=state.url,
+                page_index=-1,  # Not on page
+            )
+        )
+
+    return games_by_url
+
+
 def run_scraper(
     headless: bool = DEFAULT_HEADLESS,
     dry_run: bool = False,
     max_games: Optional[int] = None,
+    concurrency: int = MAX_CONCURRENT_GAMES,
+    max_age: int = GAMES_CACHE_MAX_AGE,
 ) -> List[GameScreenshotResult]:
     """
     Run the main scraping process.
@@ -105,6 +162,8 @@ def run_scraper(
         headless: Whether to run the browser in headless mode
         dry_run: If True, don't save to Excel
         max_games: Maximum number of games to process (None for all)
+        concurrency: Number of browsers processing games in parallel
+        max_age: Reuse a games list from an earlier run up to this many seconds old
 
     Returns:
         List of GameScreenshotResult objects
@@ -119,99 +178,77 @@ def run_scraper(
     # Ensure screenshot directory exists
     ensure_screenshot_dir(today)
 
-    # Get existing games from Excel for today
+    # Get existing games from Excel for today, split into final and in-progress
     existing_games = get_existing_games(EXCEL_FILE_PATH, today)
+    final_ids = set()
+    in_progress: List[GameState] = []
     if existing_games:
         log_info(f"Found {len(existing_games)} existing games in Excel for today")
-        for game_id, state in existing_games.items():
-            status = "FINAL" if state.is_final else "in progress"
-            log_info(f"  - {game_id}: {status}")
+    for game_id, state in existing_games.items():
+        if state.is_final:
+            final_ids.add(game_id)
+        else:
+            in_progress.append(state)
+        log_info(f"  - {game_id}: {'FINAL' if state.is_final else 'in progress'}")
+
+    # Nothing can change once every game is FINAL, so don't launch a browser.
+    # Today's last games list (whatever its age) guards against games that
+    # were listed but never made it into Excel.
+    if existing_games and not in_progress:
+        listed = load_cached_games(today, max_age=24 * 60 * 60) or []
+        if all(game.game_id in final_ids for game in listed):
+            log_info("All of today's games are already FINAL - skipping scrape")
+            return results
 
     with sync_playwright() as p:
         # Launch browser
         log_info("Launching browser...")
-        browser = p.chromium.launch(headless=headless)
-        context = browser.new_context(viewport=DEFAULT_VIEWPORT)
-        page = context.new_page()
+        context, page = open_browser_page(p, headless, "main")
 
         try:
             # Get today's games from Polymarket
-            games = get_games_for_today(page)
-            today_game_ids = {game.game_id for game in games}
+            games = get_games_for_today(page, max_age)
+            # Taken before FINAL games are dropped and --max-games is applied, so
+            # games left out only by those filters aren't mistaken for missing ones
+            today_game_ids = frozenset(game.game_id for game in games)
 
             log_info(f"Found {len(games)} games on Polymarket for today")
 
+            # Games already recorded as FINAL can't change
+            for game in games:
+                if game.game_id in final_ids:
+                    log_info(f"Skipping {game.game_id} - already marked as FINAL")
+            games = [game for game in games if game.game_id not in final_ids]
+
             # Limit games if specified
             if max_games is not None and max_games > 0:
                 games = games[:max_games]
                 log_info(f"Limited to {len(games)} games")
 
-            # Process each game from today's page
-            for i, game in enumerate(games):
-                log_info(f"\n--- Processing game {i + 1}/{len(games)} ---")
-
-                # Use game.page_index to click the correct game on the page
-                result = process_game(page, game, game.page_index)
-                results.append(result)
+            # Add games that are in Excel but no longer on today's page
+            # (games that may have ended and been removed from the main list)
+            games_by_url = get_games_to_check_by_url(in_progress, today_game_ids)
+            if games_by_url:
+                log_info(f"\n=== Including {len(games_by_url)} games by URL ===")
 
-                # Rate limiting between games
-                if i < len(games) - 1:
-                    log_info(f"Waiting {REQUEST_DELAY}s before next game...")
-                    time.sleep(REQUEST_DELAY)
+            jobs = games + games_by_url
 
-            # Process games that are in Excel but no longer on today's page
-            # (games that may have ended and been removed from the main list)
-            games_to_check_by_url = []
-            for game_id, state in existing_games.items():
-                if game_id not in today_game_ids:
-                    if state.is_final:
-                        log_info(f"Skipping {game_id} - already marked as FINAL")
-                    elif state.url:
-                        log_info(f"Game {game_id} not on today's page, will check by URL")
-                        games_to_check_by_url.append(state)
-                    else:
-                        log_warning(f"Game {game_id} not on today's page and no URL stored - skipping")
-
-            # Process games by URL
-            if games_to_check_by_url:
-                log_info(f"\n=== Processing {len(games_to_check_by_url)} games by URL ===")
-
-                for i, state in enumerate(games_to_check_by_url):
-                    log_info(f"\n--- Processing game by URL {i + 1}/{len(games_to_check_by_url)} ---")
-
-                    # Create a GameInfo from the stored state
-                    # Parse game_id format: "YYYY-MM-DD_Away_Home"
-                    parts = state.game_id.split("_")
-                    if len(parts) >= 3:
-                        game_date = parts[0]
-                        away_team = parts[1]
-                        home_team = parts[2]
-
-                        game = GameInfo(
-                            home=home_team,
-                            away=away_team,
-                            start_time=None,
-                            game_date=game_date,
-                            url=state.url,
-                            page_index=-1,  # Not on page
-                        )
-
-                        result = process_game_by_url(page, game)
-                        results.append(result)
-
-                        # Rate limiting
-                        if i < len(games_to_check_by_url) - 1:
-                            log_info(f"Waiting {REQUEST_DELAY}s before next game...")
-                            time.sleep(REQUEST_DELAY)
-                    else:
-                        log_warning(f"Could not parse game_id: {state.game_id}")
+            if concurrency > 1 and len(jobs) > 1:
+                # Listing is done; free this browser, the workers launch their own
+                context.close()
+                context = None
+                log_info("Browser closed")
+                results = process_games(jobs, concurrency, headless, dry_run=dry_run)
+            else:
+                results = process_games(jobs, page=page, dry_run=dry_run)
 
         except Exception as e:
             log_error(f"Error during scraping: {e}")
 
         finally:
-            browser.close()
-            log_info("Browser closed")
+            if context is not None:
+                context.close()
+                log_info("Browser closed")
 
     return results
 
@@ -234,6 +271,24 @@ def main(
         "-n",
         help="Maximum number of games to process",
     ),
+    concurrency: int = typer.Option(
+        MAX_CONCURRENT_GAMES,
+        "--concurrency",
+        "-j",
+        min=1,
+        help="Number of browsers processing games in parallel",
+    ),
+    max_age: int = typer.Option(
+        GAMES_CACHE_MAX_AGE,
+        "--max-age",
+        min=0,
+        help="Reuse today's games list if listed within this many seconds (0 to always re-list)",
+    ),
+    export_table: bool = typer.Option(
+        False,
+        "--export-table",
+        help="Rebuild the flat price table XLSX from the CSV log and exit",
+    ),
 ):
     """
     Run the Polymarket NBA price scraper.
@@ -242,11 +297,17 @@ def main(
     """
     print_banner()
 
+    if export_table:
+        rebuild_xlsx(CSV_FILE_PATH, TABLE_XLSX_PATH)
+        return
+
     # Run the scraper
     results = run_scraper(
         headless=headless,
         dry_run=dry_run,
         max_games=max_games,
+        concurrency=concurrency,
+        max_age=max_age,
     )
 
     # Print summary
@@ -265,7 +326,8 @@ def main(
     # Save to Excel (unless dry run)
     if not dry_run and results:
         log_info("\nSaving results to Excel...")
-        appended = append_results(results, EXCEL_FILE_PATH)
+        append_results(results, EXCEL_FILE_PATH)
+        append_csv(results, CSV_FILE_PATH)
         today = get_today_date_str()
         entry_counts = get_entry_count(EXCEL_FILE_PATH, today)
         sheets = get_sheet_names(EXCEL_FILE_PATH)
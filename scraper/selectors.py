@@ -7,6 +7,8 @@ These may change with deployments. Text-based selectors are preferred for stabil
 Discovered from live site analysis on 2025-12-09.
 """
 
+import re
+
 
 class GamesPageSelectors:
     """Selectors for the NBA games list page."""
@@ -14,6 +16,9 @@ class GamesPageSelectors:
     # The games list uses virtualization
     VIRTUOSO_LIST = '[data-testid="virtuoso-item-list"]'
 
+    # Each game row is rendered in its own item of that list
+    GAME_ROW = '[data-testid="virtuoso-item-list"] > [data-index]'
+
     # Game View button text (most reliable)
     GAME_VIEW_TEXT = "Game View"
 
@@ -53,13 +58,31 @@ class GamePageSelectors:
     # Price elements
     PRICE_SPAN_PATTERN = "span"  # Filter with has_text="¢"
 
+    # Game status badge
+    FINAL_TEXT = "Final"
+
     # Back navigation
     BACK_TO_NBA = "Back to NBA"
 
 
 def get_game_view_locator(page):
     """Get locator for Game View buttons on games page."""
-    return page.get_by_text(GamesPageSelectors.GAME_VIEW_TEXT)
+    return page.get_by_text(GamesPageSelectors.GAME_VIEW_TEXT, exact=True)
+
+
+def get_game_view_link_locator(page):
+    """
+    Get locator for Game View links/buttons, numbered like the row extractor's.
+
+    Matches the innermost <a>/<button> elements whose whole text is
+    "Game View", the same elements GAME_ROWS_JS parses rows around, so
+    nth(i) opens the game of row i.
+    """
+    return page.locator("a, button").filter(
+        # Matched against the raw text, so allow the whitespace the extractor trims
+        has_text=re.compile(r"^\s*" + r"\s+".join(GamesPageSelectors.GAME_VIEW_TEXT.split()) + r"\s*$"),
+        has_not=page.locator("a, button"),
+    )
 
 
 def get_moneyline_locator(page):
@@ -67,6 +90,19 @@ def get_moneyline_locator(page):
     return page.get_by_text(GamePageSelectors.MONEYLINE_TEXT, exact=True)
 
 
+def get_game_page_locator(page):
+    """
+    Get locator for elements every game page renders: the back link or a
+    market tab (games without a moneyline still have the others).
+    """
+    return (
+        page.get_by_text(GamePageSelectors.BACK_TO_NBA, exact=True)
+        .or_(get_moneyline_locator(page))
+        .or_(page.get_by_text(GamePageSelectors.SPREADS_TEXT, exact=True))
+        .or_(page.get_by_text(GamePageSelectors.TOTALS_TEXT, exact=True))
+    )
+
+
 def get_graph_locator(page):
     """Get locator for Graph tab."""
     return page.get_by_text(GamePageSelectors.GRAPH_TEXT, exact=True)
@@ -77,6 +113,12 @@ def get_time_period_locator(page, period: str = "6H"):
     return page.get_by_text(period, exact=True)
 
 
+def get_final_badge_locator(page):
+    """Get locator for a visible "Final" status badge."""
+    # Hidden copies (tooltips, collapsed panels) don't mean the game has ended
+    return page.get_by_text(GamePageSelectors.FINAL_TEXT, exact=True).filter(visible=True)
+
+
 def get_chart_locator(page):
     """Get locator for the chart container (for screenshots)."""
     # Try multiple selectors in order of preference
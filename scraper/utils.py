@@ -2,34 +2,97 @@
 Utility functions for the Polymarket NBA scraper.
 """
 
+import json
+import os
+import random
 import re
 import time
-from datetime import datetime
+from datetime import datetime, time as dt_time, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
+from zoneinfo import ZoneInfo
 
-import pytz
+from playwright.sync_api import Error as PlaywrightError
 from rich.console import Console
 
-from .config import TIMEZONE, SCREENSHOTS_DIR, RETRY_ATTEMPTS, RETRY_DELAY
+from .config import (
+    LOG_LEVEL,
+    TIMEZONE,
+    SCREENSHOTS_DIR,
+    SCREENSHOT_FORMAT,
+    RETRY_ATTEMPTS,
+    RETRY_DELAY,
+    RETRY_MAX_DELAY,
+)
 
-console = Console()
+# Rich's automatic highlighting runs a set of regexes over every message; log
+# lines color themselves through markup, so it's turned off for all of them
+console = Console(highlight=False)
+
+# Message levels, least severe first; messages below LOG_LEVEL aren't printed
+_LOG_LEVELS = {"INFO": 0, "SUCCESS": 1, "WARNING": 2, "ERROR": 3}
+_MIN_LOG_LEVEL = _LOG_LEVELS.get(LOG_LEVEL.upper(), 0)
+
+# Markup prefixes for each level
+_SUCCESS_PREFIX = "[green]✓[/green] "
+_ERROR_PREFIX = "[red]✗[/red] "
+_WARNING_PREFIX = "[yellow]![/yellow] "
+_INFO_PREFIX = "[blue]ℹ[/blue] "
+
+# Price text patterns, e.g. "SAC39¢"
+_PRICE_RE = re.compile(r"(\d+)\s*¢")
+_TEAM_RE = re.compile(r"^([A-Z]{2,3})")
+# Both at once: optional team code at the start, then the first price
+_PRICE_CELL_RE = re.compile(r"^([A-Z]{2,3})?.*?(\d+)\s*¢", re.DOTALL)
+# The same per line, for texts joined one per line
+_PRICE_LINE_RE = re.compile(r"^([A-Z]{2,3})?.*?(\d+)[^\S\n]*¢", re.MULTILINE)
+
+# Prices as floats for every whole-cent price (0-100¢), so parsing reuses them
+_CENT_TO_FLOAT = tuple(cents / 100.0 for cents in range(101))
+
+# Characters that aren't alphanumeric, space, or hyphen (unsafe in filenames)
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w\s-]")
+
+# Errors worth retrying: network and timeout failures. requests' errors are
+# OSErrors; Playwright raises its Error (or TimeoutError, a subclass) for
+# net::ERR_* navigation failures
+_RETRYABLE_ERRORS = (OSError, PlaywrightError)
+
+# Screenshot directories already created by this process
+_CREATED_SCREENSHOT_DIRS = set()
+_SCREENSHOT_EXTENSION = "jpg" if SCREENSHOT_FORMAT == "jpeg" else "png"
+
+# Reference timezone, resolved once
+_EASTERN = ZoneInfo(TIMEZONE)
+
+# Today's date string and the time.time() at which the day ends
+_TODAY_CACHE = ("", 0.0)
 
 
 def get_eastern_now() -> datetime:
     """Get current datetime in US/Eastern timezone."""
-    eastern = pytz.timezone(TIMEZONE)
-    return datetime.now(eastern)
+    return datetime.now(_EASTERN)
 
 
 def get_today_date_str() -> str:
-    """Get today's date as YYYY-MM-DD string in Eastern time."""
-    return get_eastern_now().strftime("%Y-%m-%d")
+    """Get today's date as YYYY-MM-DD string in Eastern time (cached until midnight)."""
+    global _TODAY_CACHE
+    today, day_end = _TODAY_CACHE
+    if time.time() < day_end:
+        return today
+
+    now = get_eastern_now()
+    today = f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
+    midnight = datetime.combine(now.date() + timedelta(days=1), dt_time.min, tzinfo=_EASTERN)
+    _TODAY_CACHE = (today, midnight.timestamp())
+    return today
 
 
 def get_timestamp_str() -> str:
     """Get current timestamp as YYYYMMDD_HHMMSS string."""
-    return get_eastern_now().strftime("%Y%m%d_%H%M%S")
+    # Formatted from the fields directly; strftime is slower for a fixed format
+    now = get_eastern_now()
+    return f"{now.year:04d}{now.month:02d}{now.day:02d}_{now.hour:02d}{now.minute:02d}{now.second:02d}"
 
 
 def get_iso_timestamp() -> str:
@@ -51,10 +114,10 @@ def parse_price_text(price_text: str) -> Optional[float]:
     price_text = price_text.strip().replace("\n", "")
 
     # Find the number before ¢
-    match = re.search(r"(\d+)\s*¢", price_text)
+    match = _PRICE_RE.search(price_text)
     if match:
         cents = int(match.group(1))
-        return cents / 100.0
+        return _CENT_TO_FLOAT[cents] if cents <= 100 else cents / 100.0
 
     return None
 
@@ -72,13 +135,55 @@ def extract_team_from_price(price_text: str) -> Optional[str]:
     price_text = price_text.strip().replace("\n", "")
 
     # Match 2-3 letter team code at the start
-    match = re.match(r"^([A-Z]{2,3})", price_text)
+    match = _TEAM_RE.match(price_text)
     if match:
         return match.group(1)
 
     return None
 
 
+def parse_price_cell(price_text: str) -> Tuple[Optional[str], Optional[float]]:
+    """
+    Parse the team and price from text like "SAC39¢" in one pass.
+
+    Gives the same results as extract_team_from_price and parse_price_text
+    whenever the text has a price; without one, both are None.
+
+    Args:
+        price_text: Text containing team and price
+
+    Returns:
+        Tuple of (team abbreviation or None, price as a float between 0 and 1),
+        or (None, None) if there is no price
+    """
+    match = _PRICE_CELL_RE.match(price_text.strip().replace("\n", ""))
+    if match:
+        cents = int(match.group(2))
+        return match.group(1), _CENT_TO_FLOAT[cents] if cents <= 100 else cents / 100.0
+
+    return None, None
+
+
+def parse_all_prices(price_texts: str) -> List[Tuple[Optional[str], float]]:
+    """
+    Parse the team and price from many price texts in a single regex scan.
+
+    Each line is treated like one parse_price_cell call, so the texts must
+    already have their own newlines removed.
+
+    Args:
+        price_texts: Price texts like "SAC39¢", one per line
+
+    Returns:
+        List of (team abbreviation or None, price) for each line with a price
+    """
+    prices = []
+    for match in _PRICE_LINE_RE.finditer(price_texts):
+        cents = int(match.group(2))
+        prices.append((match.group(1), _CENT_TO_FLOAT[cents] if cents <= 100 else cents / 100.0))
+    return prices
+
+
 def ensure_screenshot_dir(date_str: Optional[str] = None) -> Path:
     """
     Ensure the screenshot directory for a given date exists.
@@ -93,7 +198,9 @@ def ensure_screenshot_dir(date_str: Optional[str] = None) -> Path:
         date_str = get_today_date_str()
 
     dir_path = SCREENSHOTS_DIR / date_str
-    dir_path.mkdir(parents=True, exist_ok=True)
+    if date_str not in _CREATED_SCREENSHOT_DIRS:
+        dir_path.mkdir(parents=True, exist_ok=True)
+        _CREATED_SCREENSHOT_DIRS.add(date_str)
     return dir_path
 
 
@@ -113,7 +220,7 @@ def generate_screenshot_path(home_team: str, away_team: str, date_str: Optional[
         date_str = get_today_date_str()
 
     timestamp = get_timestamp_str()
-    filename = f"{home_team}_{away_team}_{timestamp}.png"
+    filename = f"{home_team}_{away_team}_{timestamp}.{_SCREENSHOT_EXTENSION}"
 
     dir_path = ensure_screenshot_dir(date_str)
     return dir_path / filename
@@ -130,15 +237,40 @@ def sanitize_team_name(name: str) -> str:
         Sanitized string safe for filenames
     """
     # Remove any characters that aren't alphanumeric, space, or hyphen
-    sanitized = re.sub(r"[^\w\s-]", "", name)
+    sanitized = _UNSAFE_FILENAME_RE.sub("", name)
     # Replace spaces with underscores
     sanitized = sanitized.replace(" ", "_")
     return sanitized
 
 
+def write_json_atomic(path: Path, data):
+    """
+    Write data to a JSON file without readers ever seeing half a file.
+
+    The JSON goes to a temporary file next to the target first, which is
+    then swapped in, so an interrupted run leaves the old file intact.
+
+    Args:
+        path: File to write
+        data: JSON-serializable data
+
+    Raises:
+        OSError: If the file can't be written
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1)
+    os.replace(tmp_path, path)
+
+
 def retry_on_failure(func, *args, max_attempts: int = RETRY_ATTEMPTS, delay: int = RETRY_DELAY, **kwargs):
     """
-    Retry a function on failure with exponential backoff.
+    Retry a function on network or timeout failure with exponential backoff.
+
+    The wait doubles after each failure (capped at RETRY_MAX_DELAY) plus up
+    to 10% random jitter, so concurrent callers don't retry in lockstep.
+    Other exceptions are raised straight away.
 
     Args:
         func: Function to call
@@ -158,13 +290,14 @@ def retry_on_failure(func, *args, max_attempts: int = RETRY_ATTEMPTS, delay: int
     for attempt in range(1, max_attempts + 1):
         try:
             return func(*args, **kwargs)
-        except Exception as e:
+        except _RETRYABLE_ERRORS as e:
             last_exception = e
             if attempt < max_attempts:
-                wait_time = delay * attempt  # Simple linear backoff
+                wait_time = min(RETRY_MAX_DELAY, delay * 2 ** (attempt - 1))
+                wait_time += random.uniform(0, wait_time * 0.1)
                 console.print(
                     f"[yellow]Attempt {attempt}/{max_attempts} failed: {e}. "
-                    f"Retrying in {wait_time}s...[/yellow]"
+                    f"Retrying in {wait_time:.1f}s...[/yellow]"
                 )
                 time.sleep(wait_time)
             else:
@@ -175,19 +308,22 @@ def retry_on_failure(func, *args, max_attempts: int = RETRY_ATTEMPTS, delay: int
 
 def log_success(message: str):
     """Log a success message."""
-    console.print(f"[green]✓[/green] {message}")
+    if _MIN_LOG_LEVEL <= _LOG_LEVELS["SUCCESS"]:
+        console.print(_SUCCESS_PREFIX + message)
 
 
 def log_error(message: str):
     """Log an error message."""
-    console.print(f"[red]✗[/red] {message}")
+    console.print(_ERROR_PREFIX + message)
 
 
 def log_warning(message: str):
     """Log a warning message."""
-    console.print(f"[yellow]![/yellow] {message}")
+    if _MIN_LOG_LEVEL <= _LOG_LEVELS["WARNING"]:
+        console.print(_WARNING_PREFIX + message)
 
 
 def log_info(message: str):
     """Log an info message."""
-    console.print(f"[blue]ℹ[/blue] {message}")
+    if _MIN_LOG_LEVEL <= _LOG_LEVELS["INFO"]:
+        console.print(_INFO_PREFIX + message)